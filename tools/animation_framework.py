@@ -16,12 +16,38 @@ Features:
 
 import math
 import time
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_config(config: Dict) -> bytes:
+    """Serialize a config dict to pretty-printed JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
+
+def _loads_config(data: bytes) -> Dict:
+    """Parse JSON config bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 2**x == exp(x * ln 2); math.exp is noticeably faster than math.pow on
+# CPython, so the exponential/elastic easings use these precomputed factors.
+_LN2_10 = 10.0 * math.log(2.0)
+_LN2_20 = 20.0 * math.log(2.0)
+
 
 class EasingFunction(Enum):
     """Standard easing functions"""
@@ -52,6 +78,12 @@ class EasingFunction(Enum):
     EASE_IN_OUT_BOUNCE = "ease-in-out-bounce"
 
 
+# Enum .value goes through DynamicClassAttribute and EasingFunction(str) does
+# an O(N) reverse scan; serialization paths use these O(1) caches instead.
+_EASING_VALUES = {e: e.value for e in EasingFunction}
+_EASING_FROM_STR = {e.value: e for e in EasingFunction}
+
+
 class AnimationType(Enum):
     """Types of animations"""
     FADE = "fade"
@@ -129,12 +161,12 @@ class Easing:
     @staticmethod
     def ease_in_expo(t: float) -> float:
         """Exponential ease-in"""
-        return 0 if t == 0 else math.pow(2, 10 * (t - 1))
+        return 0 if t == 0 else math.exp(_LN2_10 * (t - 1))
     
     @staticmethod
     def ease_out_expo(t: float) -> float:
         """Exponential ease-out"""
-        return 1 if t == 1 else 1 - math.pow(2, -10 * t)
+        return 1 if t == 1 else 1 - math.exp(-_LN2_10 * t)
     
     @staticmethod
     def ease_in_out_expo(t: float) -> float:
@@ -142,8 +174,8 @@ class Easing:
         if t == 0 or t == 1:
             return t
         if t < 0.5:
-            return math.pow(2, 20 * t - 10) / 2
-        return (2 - math.pow(2, -20 * t + 10)) / 2
+            return math.exp(_LN2_20 * t - _LN2_10) / 2
+        return (2 - math.exp(-_LN2_20 * t + _LN2_10)) / 2
     
     @staticmethod
     def ease_in_back(t: float, s: float = 1.70158) -> float:
@@ -199,7 +231,7 @@ class Easing:
         if t == 0 or t == 1:
             return t
         s = period / 4
-        return amplitude * math.pow(2, -10 * t) * math.sin((t - s) * (2 * math.pi) / period) + 1
+        return amplitude * math.exp(-_LN2_10 * t) * math.sin((t - s) * (2 * math.pi) / period) + 1
     
     @staticmethod
     def ease_in_elastic(t: float, amplitude: float = 1, period: float = 0.3) -> float:
@@ -222,34 +254,38 @@ class Easing:
     @staticmethod
     def get_easing_function(easing: EasingFunction) -> Callable[[float], float]:
         """Get easing function by name"""
-        mapping = {
-            EasingFunction.LINEAR: Easing.linear,
-            EasingFunction.EASE_IN: Easing.ease_in_quad,
-            EasingFunction.EASE_OUT: Easing.ease_out_quad,
-            EasingFunction.EASE_IN_OUT: Easing.ease_in_out_quad,
-            EasingFunction.EASE_IN_QUAD: Easing.ease_in_quad,
-            EasingFunction.EASE_OUT_QUAD: Easing.ease_out_quad,
-            EasingFunction.EASE_IN_OUT_QUAD: Easing.ease_in_out_quad,
-            EasingFunction.EASE_IN_CUBIC: Easing.ease_in_cubic,
-            EasingFunction.EASE_OUT_CUBIC: Easing.ease_out_cubic,
-            EasingFunction.EASE_IN_OUT_CUBIC: Easing.ease_in_out_cubic,
-            EasingFunction.EASE_IN_QUART: Easing.ease_in_quart,
-            EasingFunction.EASE_OUT_QUART: Easing.ease_out_quart,
-            EasingFunction.EASE_IN_OUT_QUART: Easing.ease_in_out_quart,
-            EasingFunction.EASE_IN_EXPO: Easing.ease_in_expo,
-            EasingFunction.EASE_OUT_EXPO: Easing.ease_out_expo,
-            EasingFunction.EASE_IN_OUT_EXPO: Easing.ease_in_out_expo,
-            EasingFunction.EASE_IN_BACK: Easing.ease_in_back,
-            EasingFunction.EASE_OUT_BACK: Easing.ease_out_back,
-            EasingFunction.EASE_IN_OUT_BACK: Easing.ease_in_out_back,
-            EasingFunction.EASE_IN_BOUNCE: Easing.ease_in_bounce,
-            EasingFunction.EASE_OUT_BOUNCE: Easing.ease_out_bounce,
-            EasingFunction.EASE_IN_OUT_BOUNCE: Easing.ease_in_out_bounce,
-            EasingFunction.EASE_IN_ELASTIC: Easing.ease_in_elastic,
-            EasingFunction.EASE_OUT_ELASTIC: Easing.ease_out_elastic,
-            EasingFunction.EASE_IN_OUT_ELASTIC: Easing.ease_in_out_elastic,
-        }
-        return mapping.get(easing, Easing.linear)
+        return _EASING_DISPATCH.get(easing, Easing.linear)
+
+
+# Built once at import; get_easing_function is called per frame, so the
+# dispatch table must not be reconstructed on every lookup.
+_EASING_DISPATCH: Dict[EasingFunction, Callable[[float], float]] = {
+    EasingFunction.LINEAR: Easing.linear,
+    EasingFunction.EASE_IN: Easing.ease_in_quad,
+    EasingFunction.EASE_OUT: Easing.ease_out_quad,
+    EasingFunction.EASE_IN_OUT: Easing.ease_in_out_quad,
+    EasingFunction.EASE_IN_QUAD: Easing.ease_in_quad,
+    EasingFunction.EASE_OUT_QUAD: Easing.ease_out_quad,
+    EasingFunction.EASE_IN_OUT_QUAD: Easing.ease_in_out_quad,
+    EasingFunction.EASE_IN_CUBIC: Easing.ease_in_cubic,
+    EasingFunction.EASE_OUT_CUBIC: Easing.ease_out_cubic,
+    EasingFunction.EASE_IN_OUT_CUBIC: Easing.ease_in_out_cubic,
+    EasingFunction.EASE_IN_QUART: Easing.ease_in_quart,
+    EasingFunction.EASE_OUT_QUART: Easing.ease_out_quart,
+    EasingFunction.EASE_IN_OUT_QUART: Easing.ease_in_out_quart,
+    EasingFunction.EASE_IN_EXPO: Easing.ease_in_expo,
+    EasingFunction.EASE_OUT_EXPO: Easing.ease_out_expo,
+    EasingFunction.EASE_IN_OUT_EXPO: Easing.ease_in_out_expo,
+    EasingFunction.EASE_IN_BACK: Easing.ease_in_back,
+    EasingFunction.EASE_OUT_BACK: Easing.ease_out_back,
+    EasingFunction.EASE_IN_OUT_BACK: Easing.ease_in_out_back,
+    EasingFunction.EASE_IN_BOUNCE: Easing.ease_in_bounce,
+    EasingFunction.EASE_OUT_BOUNCE: Easing.ease_out_bounce,
+    EasingFunction.EASE_IN_OUT_BOUNCE: Easing.ease_in_out_bounce,
+    EasingFunction.EASE_IN_ELASTIC: Easing.ease_in_elastic,
+    EasingFunction.EASE_OUT_ELASTIC: Easing.ease_out_elastic,
+    EasingFunction.EASE_IN_OUT_ELASTIC: Easing.ease_in_out_elastic,
+}
 
 
 @dataclass
@@ -263,7 +299,7 @@ class Keyframe:
         return {
             'offset': self.offset,
             'value': self.value,
-            'easing': self.easing.value if self.easing else 'linear'
+            'easing': _EASING_VALUES[self.easing] if self.easing else 'linear'
         }
 
 
@@ -305,11 +341,58 @@ class SpringPhysics:
         new_position = from_value + new_velocity * delta_time
         
         # Check if at rest
-        is_at_rest = (abs(new_velocity) < config.precision and 
+        is_at_rest = (abs(new_velocity) < config.precision and
                      abs(new_position - to_value) < config.precision)
-        
+
         return new_position, new_velocity, is_at_rest
 
+    @staticmethod
+    def analytic(from_value: float, to_value: float, config: SpringConfig,
+                 elapsed: float) -> Tuple[float, float, bool]:
+        """
+        Evaluate the damped spring in closed form at elapsed seconds.
+        Returns: (position, velocity, is_at_rest)
+
+        A linear damped oscillator with a fixed target has an analytic
+        solution, so one exp/sin evaluation replaces the per-frame Euler
+        stepping (and its accumulated drift).
+        """
+        x0 = from_value - to_value
+        v0 = config.velocity
+        omega0 = math.sqrt(config.stiffness / config.mass)
+        zeta = config.damping / (2 * math.sqrt(config.stiffness * config.mass))
+
+        if zeta < 1:
+            # Under-damped: decaying oscillation
+            omega_d = omega0 * math.sqrt(1 - zeta * zeta)
+            decay = math.exp(-zeta * omega0 * elapsed)
+            b = (v0 + zeta * omega0 * x0) / omega_d
+            cos_t = math.cos(omega_d * elapsed)
+            sin_t = math.sin(omega_d * elapsed)
+            displacement = decay * (x0 * cos_t + b * sin_t)
+            velocity = decay * ((b * omega_d - x0 * zeta * omega0) * cos_t -
+                               (x0 * omega_d + b * zeta * omega0) * sin_t)
+        elif zeta == 1:
+            # Critically damped
+            decay = math.exp(-omega0 * elapsed)
+            b = v0 + omega0 * x0
+            displacement = decay * (x0 + b * elapsed)
+            velocity = decay * (b - omega0 * (x0 + b * elapsed))
+        else:
+            # Over-damped: two real exponential roots
+            omega_d = omega0 * math.sqrt(zeta * zeta - 1)
+            r1 = -zeta * omega0 + omega_d
+            r2 = -zeta * omega0 - omega_d
+            a = (v0 - r2 * x0) / (r1 - r2)
+            b = x0 - a
+            displacement = a * math.exp(r1 * elapsed) + b * math.exp(r2 * elapsed)
+            velocity = a * r1 * math.exp(r1 * elapsed) + b * r2 * math.exp(r2 * elapsed)
+
+        is_at_rest = (abs(velocity) < config.precision and
+                     abs(displacement) < config.precision)
+
+        return to_value + displacement, velocity, is_at_rest
+
 
 @dataclass
 class Animation:
@@ -327,7 +410,7 @@ class Animation:
     on_complete: Optional[Callable] = None
     
     # State
-    start_time: Optional[float] = None
+    start_time: Optional[int] = None  # perf_counter_ns timestamp
     current_time: float = 0
     current_iteration: int = 0
     is_playing: bool = False
@@ -337,7 +420,7 @@ class Animation:
     def to_dict(self) -> Dict:
         return {
             'duration': self.duration,
-            'easing': self.easing.value,
+            'easing': _EASING_VALUES[self.easing],
             'delay': self.delay,
             'iterations': self.iterations,
             'direction': self.direction,
@@ -415,26 +498,27 @@ class SpringAnimation(Animation):
     # Spring state
     current_value: float = 0
     current_velocity: float = 0
-    
+    elapsed_time: float = 0
+
     def __post_init__(self):
         self.current_value = self.from_value
         self.current_velocity = self.config.velocity
-    
+
     def step(self, delta_time: float = 0.016) -> Tuple[float, bool]:
         """
         Advance spring simulation
         Returns: (current_value, is_at_rest)
         """
-        self.current_value, self.current_velocity, is_at_rest = SpringPhysics.calculate(
-            self.current_value,
+        # Closed-form evaluation from the initial conditions at total
+        # elapsed time; O(1) per query and drift-free.
+        self.elapsed_time += delta_time
+        self.current_value, self.current_velocity, is_at_rest = SpringPhysics.analytic(
+            self.from_value,
             self.to_value,
             self.config,
-            delta_time
+            self.elapsed_time
         )
-        
-        # Update config velocity for next step
-        self.config.velocity = self.current_velocity
-        
+
         return self.current_value, is_at_rest
 
 
@@ -470,11 +554,9 @@ class StaggeredAnimation:
         item_count: Number of items to animate
         stagger_delay: Delay between each item (ms)
         """
-        self.animations = []
-        for i in range(item_count):
-            anim = animation_factory(i)
+        self.animations = [animation_factory(i) for i in range(item_count)]
+        for i, anim in enumerate(self.animations):
             anim.delay += i * stagger_delay
-            self.animations.append(anim)
     
     def get_total_duration(self) -> float:
         """Calculate total duration"""
@@ -691,7 +773,7 @@ class AnimationManager:
     
     def __init__(self):
         self.animations: Dict[str, Animation] = {}
-        self.running_animations: List[str] = []
+        self.running_animations: Set[str] = set()
     
     def register(self, name: str, animation: Animation):
         """Register an animation"""
@@ -702,11 +784,10 @@ class AnimationManager:
         if name in self.animations:
             anim = self.animations[name]
             anim.is_playing = True
-            anim.start_time = time.time() * 1000
-            
-            if name not in self.running_animations:
-                self.running_animations.append(name)
-            
+            anim.start_time = time.perf_counter_ns()
+
+            self.running_animations.add(name)
+
             if anim.on_start:
                 anim.on_start()
     
@@ -726,63 +807,75 @@ class AnimationManager:
             anim = self.animations[name]
             anim.is_playing = False
             anim.is_complete = True
-            
-            if name in self.running_animations:
-                self.running_animations.remove(name)
+
+            self.running_animations.discard(name)
     
     def update(self, delta_time: float = 0.016):
         """Update all running animations"""
-        current_time = time.time() * 1000
-        
-        for name in self.running_animations[:]:
+        # One monotonic clock read per tick; perf_counter_ns is faster and
+        # more precise than time.time(), and integer ns can't drift.
+        now_ns = time.perf_counter_ns()
+
+        # Snapshot once; completions are collected and applied after the
+        # loop so the set is never mutated mid-iteration.
+        to_stop: List[str] = []
+
+        for name in list(self.running_animations):
             anim = self.animations[name]
-            
+
             if anim.is_paused or not anim.is_playing:
                 continue
-            
+
             # Calculate elapsed time
             if anim.start_time is None:
                 continue
-            
-            elapsed = current_time - anim.start_time - anim.delay
-            
+
+            elapsed = (now_ns - anim.start_time) / 1_000_000 - anim.delay
+
             if elapsed < 0:
                 continue  # Still in delay
-            
+
             # Calculate progress (0-1)
-            progress = min(elapsed / anim.duration, 1.0)
-            
+            progress = _clamp01(elapsed / anim.duration)
+
             # Get current value
             if isinstance(anim, (TransitionAnimation, KeyframeAnimation)):
                 current_value = anim.get_current_value(progress)
-                
+
                 if anim.on_update:
                     anim.on_update(current_value)
-            
+
             elif isinstance(anim, SpringAnimation):
                 current_value, is_at_rest = anim.step(delta_time)
-                
+
                 if anim.on_update:
                     anim.on_update(current_value)
-                
+
                 if is_at_rest:
-                    self.stop(name)
+                    anim.is_playing = False
+                    anim.is_complete = True
+                    to_stop.append(name)
                     if anim.on_complete:
                         anim.on_complete()
                 continue
-            
+
             # Check if complete
             if progress >= 1.0:
                 anim.current_iteration += 1
-                
+
                 if anim.iterations == -1 or anim.current_iteration < anim.iterations:
                     # Restart for next iteration
-                    anim.start_time = current_time
+                    anim.start_time = now_ns
                 else:
                     # Complete
-                    self.stop(name)
+                    anim.is_playing = False
+                    anim.is_complete = True
+                    to_stop.append(name)
                     if anim.on_complete:
                         anim.on_complete()
+
+        if to_stop:
+            self.running_animations.difference_update(to_stop)
     
     def export_config(self, output_file: Path):
         """Export animation configurations to JSON"""
@@ -791,18 +884,19 @@ class AnimationManager:
             for name, anim in self.animations.items()
         }
         
-        output_file.write_text(json.dumps(config, indent=2))
+        output_file.write_bytes(_dumps_config(config))
     
     def import_config(self, config_file: Path):
         """Import animation configurations from JSON"""
-        config = json.loads(config_file.read_text())
+        config = _loads_config(config_file.read_bytes())
         
         for name, anim_config in config.items():
+            easing = anim_config.get('easing', 'ease-in-out')
             # Create appropriate animation type
             # This is a simplified version - would need proper type detection
             anim = TransitionAnimation(
                 duration=anim_config.get('duration', 300),
-                easing=EasingFunction(anim_config.get('easing', 'ease-in-out')),
+                easing=_EASING_FROM_STR.get(easing) or EasingFunction(easing),
                 delay=anim_config.get('delay', 0)
             )
             self.register(name, anim)
@@ -817,15 +911,18 @@ def lerp(start: float, end: float, t: float) -> float:
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
     """Clamp value between min and max"""
-    return max(min_val, min(max_val, value))
+    return min(max(value, min_val), max_val)
+
+
+def _clamp01(x: float) -> float:
+    """Clamp to [0, 1]; specialized fast path for progress values"""
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
 
 
 def create_stagger(items: List[Any], animation_factory: Callable,
                   stagger_delay: float = 50) -> List[Animation]:
     """Create staggered animations for list of items"""
-    animations = []
-    for i, item in enumerate(items):
-        anim = animation_factory(item)
+    animations = [animation_factory(item) for item in items]
+    for i, anim in enumerate(animations):
         anim.delay = i * stagger_delay
-        animations.append(anim)
     return animations
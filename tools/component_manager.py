@@ -13,16 +13,85 @@ Features:
 - Update notifications
 """
 
+import bisect
+import io
 import json
+import time
+import operator
+import os
 import shutil
+import sqlite3
+import zipfile
 import hashlib
 import requests
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-import semver
+from packaging.version import InvalidVersion, Version
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to pretty-printed JSON bytes, via orjson when present"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _json_loads(data) -> Any:
+    """Parse JSON from bytes or str, via orjson when present"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to path via a temp file + os.replace so readers never
+    observe a truncated file"""
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _fastcopy(src: Path, dst: Path) -> None:
+    """
+    Copy a file, preferring os.copy_file_range (in-kernel copy, and a
+    reflink on CoW filesystems) over shutil.copy2's userspace loop.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+                copied = True
+            except OSError:
+                # Cross-device / unsupported filesystem; restart in userspace
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        if not copied:
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while n := fsrc.readinto(buf):
+                fdst.write(view[:n])
+    shutil.copystat(src, dst)
 
 
 class ComponentType(Enum):
@@ -43,18 +112,62 @@ class ComponentStatus(Enum):
     DEPRECATED = "deprecated"
 
 
+# Comparison operator prefixes, longest first
+_CONSTRAINT_OPS = {
+    '>=': operator.ge, '<=': operator.le,
+    '==': operator.eq, '!=': operator.ne,
+    '>': operator.gt, '<': operator.lt,
+}
+
+_VERSION_ZERO = Version('0.0.0')
+
+
+def _compile_constraint(constraint: str):
+    """
+    Compile a version constraint to a Version predicate
+    Supports npm-style ^ / ~ ranges and plain comparison operators;
+    returns None if the constraint can't be parsed.
+    """
+    s = constraint.strip()
+    try:
+        if s.startswith('^'):
+            lo = Version(s[1:].strip())
+            hi = (Version(f"{lo.major + 1}.0.0") if lo.major
+                  else Version(f"0.{lo.minor + 1}.0"))
+            return lambda v: lo <= v < hi
+        if s.startswith('~'):
+            lo = Version(s[1:].strip())
+            hi = Version(f"{lo.major}.{lo.minor + 1}.0")
+            return lambda v: lo <= v < hi
+        for prefix, op in _CONSTRAINT_OPS.items():
+            if s.startswith(prefix):
+                ref = Version(s[len(prefix):].strip())
+                return lambda v, _op=op, _ref=ref: _op(v, _ref)
+        ref = Version(s)
+        return lambda v, _ref=ref: v == _ref
+    except InvalidVersion:
+        return None
+
+
 @dataclass
 class ComponentDependency:
     """Component dependency specification"""
     name: str
     version_constraint: str  # e.g., "^1.0.0", ">=2.0.0", "~1.5.0"
     optional: bool = False
-    
+
+    def __post_init__(self):
+        # Compile the constraint to a predicate once so is_satisfied_by
+        # doesn't re-tokenize the string on every check.
+        self._check = _compile_constraint(self.version_constraint)
+
     def is_satisfied_by(self, version: str) -> bool:
         """Check if version satisfies constraint"""
+        if self._check is None:
+            return False
         try:
-            return semver.match(version, self.version_constraint)
-        except:
+            return self._check(Version(version))
+        except InvalidVersion:
             return False
 
 
@@ -80,6 +193,9 @@ class ComponentMetadata:
     # Component files
     files: List[str] = field(default_factory=list)
     entry_point: Optional[str] = None
+    # Content digests of registered files (filled in by the registry's
+    # content-addressed store)
+    file_digests: Dict[str, str] = field(default_factory=dict)
     
     # Platform compatibility
     platforms: List[str] = field(default_factory=lambda: ["all"])
@@ -87,21 +203,54 @@ class ComponentMetadata:
     # Minimum requirements
     min_plhub_version: Optional[str] = None
     min_pohlang_version: Optional[str] = None
-    
+
+    def __post_init__(self):
+        # Parse the version once; comparisons elsewhere reuse the cached
+        # Version instead of re-tokenizing the string.
+        try:
+            self._ver = Version(self.version)
+        except InvalidVersion:
+            self._ver = _VERSION_ZERO
+        # Lowercased haystack so search() is one substring test per
+        # component instead of lowercasing every field per query.
+        self._search_blob = ' '.join(
+            (self.name, self.description, *self.keywords)
+        ).lower()
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        data = asdict(self)
-        data['type'] = self.type.value
-        data['status'] = self.status.value
-        data['dependencies'] = [
-            {
-                'name': dep.name,
-                'version_constraint': dep.version_constraint,
-                'optional': dep.optional
-            }
-            for dep in self.dependencies
-        ]
-        return data
+        # Explicit dict literal; dataclasses.asdict deep-copies every
+        # field through reflection, which dominates save time.
+        return {
+            'name': self.name,
+            'version': self.version,
+            'type': self.type.value,
+            'author': self.author,
+            'description': self.description,
+            'license': self.license,
+            'keywords': list(self.keywords),
+            'dependencies': [
+                {
+                    'name': dep.name,
+                    'version_constraint': dep.version_constraint,
+                    'optional': dep.optional
+                }
+                for dep in self.dependencies
+            ],
+            'repository': self.repository,
+            'homepage': self.homepage,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'downloads': self.downloads,
+            'rating': self.rating,
+            'status': self.status.value,
+            'files': list(self.files),
+            'entry_point': self.entry_point,
+            'file_digests': dict(self.file_digests),
+            'platforms': list(self.platforms),
+            'min_plhub_version': self.min_plhub_version,
+            'min_pohlang_version': self.min_pohlang_version,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'ComponentMetadata':
@@ -120,11 +269,22 @@ class ComponentMetadata:
     
     def checksum(self, component_dir: Path) -> str:
         """Calculate checksum of component files"""
+        # Stream each file through hashlib.file_digest instead of pulling
+        # whole files into memory; sort paths and include them in the
+        # digest so the result is deterministic and rename-sensitive.
         hasher = hashlib.sha256()
-        for file_rel in self.files:
+        for file_rel in sorted(self.files):
+            digest = self.file_digests.get(file_rel)
+            if digest:
+                # Registered files already carry their content digest
+                hasher.update(file_rel.encode('utf-8'))
+                hasher.update(bytes.fromhex(digest))
+                continue
             file_path = component_dir / file_rel
             if file_path.exists():
-                hasher.update(file_path.read_bytes())
+                hasher.update(file_rel.encode('utf-8'))
+                with open(file_path, 'rb', buffering=0) as f:
+                    hasher.update(hashlib.file_digest(f, 'sha256').digest())
         return hasher.hexdigest()
 
 
@@ -137,31 +297,154 @@ class ComponentRegistry:
         
         self.components_dir = self.registry_dir / "components"
         self.components_dir.mkdir(exist_ok=True)
+
+        # Content-addressed blob store; version dirs hardlink into it so
+        # files shared across versions are stored once.
+        self.blobs_dir = self.components_dir / ".blobs"
+        self.blobs_dir.mkdir(exist_ok=True)
         
-        self.index_file = self.registry_dir / "index.json"
+        # WAL-backed SQLite store: register/unregister touch only the
+        # affected rows instead of rewriting the whole index per mutation.
+        self.db = sqlite3.connect(str(self.registry_dir / "index.db"))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS components ("
+            "name TEXT, version TEXT, type TEXT, meta TEXT, "
+            "PRIMARY KEY(name, version))"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            "digest TEXT PRIMARY KEY, refs INTEGER NOT NULL)"
+        )
+        self._migrate_json_index()
         self.index = self._load_index()
+        self._in_batch = False
+
+        # Secondary index: name -> metadata sorted by version, so
+        # latest-version lookups and per-name scans avoid walking the
+        # whole registry.
+        self._by_name: Dict[str, List[ComponentMetadata]] = {}
+        # cid -> lowercase haystack, so search() runs one C-level
+        # substring scan per component with no attribute chasing
+        self._haystacks: Dict[str, str] = {}
+        for cid, meta in self.index.items():
+            bisect.insort(
+                self._by_name.setdefault(meta.name, []), meta,
+                key=lambda m: m._ver
+            )
+            self._haystacks[cid] = meta._search_blob
     
+    def _migrate_json_index(self):
+        """One-time import of a legacy index.json into the SQLite store"""
+        legacy = self.registry_dir / "index.json"
+        if not legacy.exists():
+            return
+        if self.db.execute("SELECT COUNT(*) FROM components").fetchone()[0] == 0:
+            try:
+                data = _json_loads(legacy.read_bytes())
+            except:
+                data = {}
+            with self.db:
+                for meta in data.values():
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO components VALUES (?, ?, ?, ?)",
+                        (meta['name'], meta['version'], meta['type'],
+                         _json_dumps(meta))
+                    )
+        legacy.unlink()
+
     def _load_index(self) -> Dict[str, ComponentMetadata]:
         """Load component index"""
-        if self.index_file.exists():
+        index = {}
+        for (meta_json,) in self.db.execute("SELECT meta FROM components"):
             try:
-                data = json.loads(self.index_file.read_text())
-                return {
-                    name: ComponentMetadata.from_dict(meta)
-                    for name, meta in data.items()
-                }
+                meta = ComponentMetadata.from_dict(_json_loads(meta_json))
             except:
-                return {}
-        return {}
-    
-    def _save_index(self):
-        """Save component index"""
-        data = {
-            name: meta.to_dict()
-            for name, meta in self.index.items()
-        }
-        self.index_file.write_text(json.dumps(data, indent=2))
+                continue
+            index[meta.get_id()] = meta
+        return index
+
+    @contextmanager
+    def batch(self):
+        """Group several register/unregister calls into one transaction"""
+        if self._in_batch:
+            yield
+            return
+        self._in_batch = True
+        try:
+            with self.db:
+                yield
+        finally:
+            self._in_batch = False
+
+    def _txn(self):
+        """Per-mutation transaction, unless an outer batch() holds one"""
+        return nullcontext() if self._in_batch else self.db
+
+    def _db_put(self, metadata: ComponentMetadata):
+        """Insert or update a single component row"""
+        with self._txn():
+            self.db.execute(
+                "INSERT OR REPLACE INTO components VALUES (?, ?, ?, ?)",
+                (metadata.name, metadata.version, metadata.type.value,
+                 _json_dumps(metadata.to_dict()))
+            )
+
+    def _db_delete(self, name: str, version: Optional[str] = None):
+        """Delete one version, or all versions, of a component"""
+        with self._txn():
+            if version:
+                self.db.execute(
+                    "DELETE FROM components WHERE name = ? AND version = ?",
+                    (name, version)
+                )
+            else:
+                self.db.execute(
+                    "DELETE FROM components WHERE name = ?", (name,)
+                )
     
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / digest[2:]
+
+    def _store_blob(self, src: Path, digest: Optional[str] = None) -> str:
+        """Add a file to the blob store (if new) and bump its refcount"""
+        if digest is None:
+            with open(src, 'rb', buffering=0) as f:
+                digest = hashlib.file_digest(f, 'sha256').hexdigest()
+
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            _fastcopy(src, blob_path)
+
+        with self._txn():
+            self.db.execute(
+                "INSERT INTO blobs VALUES (?, 1) "
+                "ON CONFLICT(digest) DO UPDATE SET refs = refs + 1",
+                (digest,)
+            )
+        return digest
+
+    def _release_blobs(self, metadata: ComponentMetadata):
+        """Drop blob references; unlink blobs nothing points at anymore"""
+        if not metadata.file_digests:
+            return
+        with self._txn():
+            for digest in metadata.file_digests.values():
+                self.db.execute(
+                    "UPDATE blobs SET refs = refs - 1 WHERE digest = ?",
+                    (digest,)
+                )
+            dead = [d for (d,) in self.db.execute(
+                "SELECT digest FROM blobs WHERE refs <= 0")]
+            self.db.executemany(
+                "DELETE FROM blobs WHERE digest = ?", [(d,) for d in dead])
+        for digest in dead:
+            blob_path = self._blob_path(digest)
+            if blob_path.exists():
+                blob_path.unlink()
+
     def register(self, metadata: ComponentMetadata, component_dir: Path) -> bool:
         """Register a new component"""
         try:
@@ -176,20 +459,47 @@ class ComponentRegistry:
             dest_dir = self.components_dir / metadata.name / metadata.version
             dest_dir.mkdir(parents=True, exist_ok=True)
             
+            # Hash files concurrently — hashing releases the GIL, so
+            # bundles of many small files overlap their reads. Blob
+            # refcounting and linking stay on this thread (the sqlite
+            # connection isn't shareable across threads).
+            def _digest_file(rel: str) -> Tuple[str, str]:
+                with open(component_dir / rel, 'rb', buffering=0) as f:
+                    return rel, hashlib.file_digest(f, 'sha256').hexdigest()
+
+            if len(metadata.files) > 4:
+                with ThreadPoolExecutor(
+                    max_workers=min(8, len(metadata.files))
+                ) as executor:
+                    digests = dict(executor.map(_digest_file, metadata.files))
+            else:
+                digests = dict(map(_digest_file, metadata.files))
+
             for file_rel in metadata.files:
                 src_file = component_dir / file_rel
                 dest_file = dest_dir / file_rel
                 dest_file.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src_file, dest_file)
+                digest = self._store_blob(src_file, digests[file_rel])
+                metadata.file_digests[file_rel] = digest
+                try:
+                    os.link(self._blob_path(digest), dest_file)
+                except OSError:
+                    # Hardlinks unavailable (e.g. FAT); fall back to a copy
+                    _fastcopy(self._blob_path(digest), dest_file)
             
             # Save metadata
             metadata_file = dest_dir / "component.json"
-            metadata_file.write_text(json.dumps(metadata.to_dict(), indent=2))
+            _atomic_write_bytes(metadata_file, _json_dumps(metadata.to_dict()))
             
             # Update index
             metadata.status = ComponentStatus.INSTALLED
             self.index[component_id] = metadata
-            self._save_index()
+            bisect.insort(
+                self._by_name.setdefault(metadata.name, []), metadata,
+                key=lambda m: m._ver
+            )
+            self._haystacks[component_id] = metadata._search_blob
+            self._db_put(metadata)
             
             print(f"✓ Registered component: {component_id}")
             return True
@@ -204,32 +514,37 @@ class ComponentRegistry:
             if version:
                 component_id = f"{name}@{version}"
                 if component_id in self.index:
-                    del self.index[component_id]
-                    
+                    meta = self.index.pop(component_id)
+                    self._haystacks.pop(component_id, None)
+                    versions = self._by_name.get(name)
+                    if versions:
+                        versions.remove(meta)
+                        if not versions:
+                            del self._by_name[name]
+
                     # Remove files
                     component_dir = self.components_dir / name / version
                     if component_dir.exists():
                         shutil.rmtree(component_dir)
-                    
-                    self._save_index()
+
+                    self._release_blobs(meta)
+                    self._db_delete(name, version)
                     print(f"✓ Unregistered: {component_id}")
                     return True
             else:
                 # Unregister all versions
-                to_remove = [
-                    cid for cid in self.index.keys()
-                    if cid.startswith(f"{name}@")
-                ]
-                
-                for cid in to_remove:
+                for meta in self._by_name.pop(name, []):
+                    cid = meta.get_id()
                     del self.index[cid]
-                
+                    self._haystacks.pop(cid, None)
+                    self._release_blobs(meta)
+
                 # Remove directory
                 component_dir = self.components_dir / name
                 if component_dir.exists():
                     shutil.rmtree(component_dir)
-                
-                self._save_index()
+
+                self._db_delete(name)
                 print(f"✓ Unregistered all versions of: {name}")
                 return True
             
@@ -244,13 +559,10 @@ class ComponentRegistry:
         if version:
             return self.index.get(f"{name}@{version}")
         else:
-            # Get latest version
-            versions = [
-                meta for cid, meta in self.index.items()
-                if cid.startswith(f"{name}@")
-            ]
+            # Versions are kept sorted, so the latest is the last entry
+            versions = self._by_name.get(name)
             if versions:
-                return max(versions, key=lambda m: semver.parse(m.version))
+                return versions[-1]
         return None
     
     def list_components(self, component_type: Optional[ComponentType] = None) -> List[ComponentMetadata]:
@@ -258,20 +570,16 @@ class ComponentRegistry:
         components = list(self.index.values())
         if component_type:
             components = [c for c in components if c.type == component_type]
-        return sorted(components, key=lambda c: (c.name, c.version))
+        return sorted(components, key=lambda c: (c.name, c._ver))
     
     def search(self, query: str) -> List[ComponentMetadata]:
         """Search components by name or keywords"""
         query_lower = query.lower()
-        results = []
-        
-        for meta in self.index.values():
-            if (query_lower in meta.name.lower() or
-                query_lower in meta.description.lower() or
-                any(query_lower in kw.lower() for kw in meta.keywords)):
-                results.append(meta)
-        
-        return results
+        index = self.index
+        return [
+            index[cid] for cid, haystack in self._haystacks.items()
+            if query_lower in haystack
+        ]
     
     def get_component_dir(self, name: str, version: str) -> Path:
         """Get component directory"""
@@ -326,35 +634,74 @@ class DependencyResolver:
     
     def get_install_order(self, components: List[ComponentMetadata]) -> List[ComponentMetadata]:
         """Get installation order based on dependencies"""
-        # Topological sort
-        installed = set()
-        result = []
-        
-        def visit(comp: ComponentMetadata):
+        # Iterative Kahn's algorithm: one registry lookup per edge, no
+        # Python recursion depth limit, and cycles can't hang the walk.
+        nodes: Dict[str, ComponentMetadata] = {}
+        dependents: Dict[str, List[str]] = {}
+        in_degree: Dict[str, int] = {}
+
+        stack = list(components)
+        while stack:
+            comp = stack.pop()
             comp_id = comp.get_id()
-            if comp_id in installed:
-                return
-            
-            # Visit dependencies first
+            if comp_id in nodes:
+                continue
+            nodes[comp_id] = comp
+            in_degree.setdefault(comp_id, 0)
+
             for dep in comp.dependencies:
                 dep_comp = self.registry.get(dep.name)
-                if dep_comp:
-                    visit(dep_comp)
-            
-            result.append(comp)
-            installed.add(comp_id)
-        
-        for comp in components:
-            visit(comp)
-        
+                if not dep_comp:
+                    continue
+                dep_id = dep_comp.get_id()
+                dependents.setdefault(dep_id, []).append(comp_id)
+                in_degree[comp_id] += 1
+                if dep_id not in nodes:
+                    stack.append(dep_comp)
+
+        queue = deque(cid for cid, deg in in_degree.items() if deg == 0)
+        result = []
+
+        while queue:
+            comp_id = queue.popleft()
+            result.append(nodes[comp_id])
+            for succ in dependents.get(comp_id, ()):
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    queue.append(succ)
+
+        if len(result) != len(nodes):
+            # Dependency cycle: emit the remaining components anyway
+            emitted = {meta.get_id() for meta in result}
+            result.extend(
+                meta for cid, meta in nodes.items() if cid not in emitted
+            )
+
         return result
 
 
 class ComponentMarketplace:
     """Component marketplace client"""
     
+    # Successful lookups are cached this long so update() doesn't refetch
+    # what check_updates() just loaded.
+    CACHE_TTL = 300  # seconds
+
     def __init__(self, marketplace_url: str = "https://marketplace.plhub.dev"):
         self.marketplace_url = marketplace_url
+        # One Session for keep-alive and connection pooling
+        self._session = requests.Session()
+        # Optional httpx client: HTTP/2 multiplexes the many small JSON
+        # lookups (search / get_component) over one TLS connection.
+        # Streaming downloads and multipart publish stay on requests.
+        self._client = None
+        if HTTPX_AVAILABLE:
+            try:
+                self._client = httpx.Client(http2=True, timeout=10.0)
+            except ImportError:
+                # h2 extra not installed; plain HTTP/1.1 client still pools
+                self._client = httpx.Client(timeout=10.0)
+        self._component_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Dict]] = {}
     
     def search(self, query: str, component_type: Optional[ComponentType] = None) -> List[Dict]:
         """Search marketplace for components"""
@@ -363,7 +710,7 @@ class ComponentMarketplace:
             if component_type:
                 params['type'] = component_type.value
             
-            response = requests.get(
+            response = (self._client or self._session).get(
                 f"{self.marketplace_url}/api/search",
                 params=params,
                 timeout=10
@@ -379,19 +726,26 @@ class ComponentMarketplace:
     
     def get_component(self, name: str, version: Optional[str] = None) -> Optional[Dict]:
         """Get component details from marketplace"""
+        cache_key = (name, version)
+        cached = self._component_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL:
+            return cached[1]
+
         try:
             url = f"{self.marketplace_url}/api/components/{name}"
             if version:
                 url += f"/{version}"
-            
-            response = requests.get(url, timeout=10)
-            
+
+            response = (self._client or self._session).get(url, timeout=10)
+
             if response.status_code == 200:
-                return response.json()
-            
+                info = response.json()
+                self._component_cache[cache_key] = (time.monotonic(), info)
+                return info
+
         except Exception as e:
             print(f"Failed to fetch component: {e}")
-        
+
         return None
     
     def download(self, name: str, version: str, dest_dir: Path) -> bool:
@@ -399,24 +753,30 @@ class ComponentMarketplace:
         try:
             url = f"{self.marketplace_url}/api/components/{name}/{version}/download"
             
-            response = requests.get(url, stream=True, timeout=30)
+            response = self._session.get(url, stream=True, timeout=30)
             
             if response.status_code == 200:
-                # Download as zip
-                zip_file = dest_dir / f"{name}-{version}.zip"
                 dest_dir.mkdir(parents=True, exist_ok=True)
-                
-                with open(zip_file, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                # Extract
-                import zipfile
-                with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-                    zip_ref.extractall(dest_dir)
-                
-                zip_file.unlink()  # Remove zip file
-                
+                response.raw.decode_content = True
+                length = int(response.headers.get('Content-Length') or 0)
+
+                if 0 < length < (64 << 20):
+                    # Small enough to extract straight from memory: no
+                    # temp zip, one pass over the payload.
+                    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_ref:
+                        zip_ref.extractall(dest_dir)
+                else:
+                    # Large or unknown size: spool to disk with a wide
+                    # copy buffer, then extract.
+                    zip_file = dest_dir / f"{name}-{version}.zip"
+                    with open(zip_file, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=1 << 20)
+
+                    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+                        zip_ref.extractall(dest_dir)
+
+                    zip_file.unlink()  # Remove zip file
+
                 print(f"✓ Downloaded: {name}@{version}")
                 return True
             
@@ -429,38 +789,54 @@ class ComponentMarketplace:
         """Publish component to marketplace"""
         try:
             # Create zip archive
-            import zipfile
             import tempfile
-            
-            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp:
-                with zipfile.ZipFile(tmp.name, 'w', zipfile.ZIP_DEFLATED) as zipf:
+
+            # Spooled file: small archives are built entirely in memory
+            # (tmpfs-backed on Linux) and uploaded without the
+            # write-to-disk / reopen round trip of a named temp file.
+            spool_dir = '/dev/shm' if Path('/dev/shm').exists() else None
+
+            # Zstandard (zipfile supports it from Python 3.14) compresses
+            # several times faster than DEFLATE at comparable ratios; on
+            # older runtimes use DEFLATE's fastest level, since archive
+            # creation, not ratio, is the publish bottleneck.
+            if hasattr(zipfile, 'ZIP_ZSTANDARD'):
+                zip_opts = {'compression': zipfile.ZIP_ZSTANDARD}
+            else:
+                zip_opts = {'compression': zipfile.ZIP_DEFLATED,
+                            'compresslevel': 1}
+
+            with tempfile.SpooledTemporaryFile(max_size=1 << 26, dir=spool_dir) as spool:
+                with zipfile.ZipFile(spool, 'w', **zip_opts) as zipf:
                     for file_rel in metadata.files:
                         file_path = component_dir / file_rel
                         if file_path.exists():
                             zipf.write(file_path, file_rel)
                     
                     # Add metadata
-                    metadata_json = json.dumps(metadata.to_dict(), indent=2)
-                    zipf.writestr('component.json', metadata_json)
-                
+                    zipf.writestr('component.json', _json_dumps(metadata.to_dict()))
+
                 # Upload
-                with open(tmp.name, 'rb') as f:
-                    files = {'file': f}
-                    headers = {'Authorization': f'Bearer {api_key}'}
-                    
-                    response = requests.post(
-                        f"{self.marketplace_url}/api/publish",
-                        files=files,
-                        headers=headers,
-                        timeout=60
-                    )
-                    
-                    if response.status_code == 201:
-                        print(f"✓ Published: {metadata.get_id()}")
-                        return True
-                    else:
-                        print(f"Publish failed: {response.text}")
-            
+                spool.seek(0)
+                files = {
+                    'file': (f"{metadata.name}-{metadata.version}.zip",
+                             spool, 'application/zip')
+                }
+                headers = {'Authorization': f'Bearer {api_key}'}
+
+                response = self._session.post(
+                    f"{self.marketplace_url}/api/publish",
+                    files=files,
+                    headers=headers,
+                    timeout=60
+                )
+
+                if response.status_code == 201:
+                    print(f"✓ Published: {metadata.get_id()}")
+                    return True
+                else:
+                    print(f"Publish failed: {response.text}")
+
         except Exception as e:
             print(f"Publish error: {e}")
         
@@ -476,41 +852,49 @@ class ComponentManager:
         self.resolver = DependencyResolver(self.registry)
         self.marketplace = ComponentMarketplace()
     
-    def install(self, name: str, version: Optional[str] = None, 
-               source: str = "marketplace") -> bool:
-        """Install a component"""
-        print(f"Installing {name}" + (f"@{version}" if version else ""))
-        
+    def _fetch_metadata(self, name: str, version: Optional[str],
+                        source: str) -> Optional[Tuple[ComponentMetadata, Path]]:
+        """
+        Fetch a component's files and parsed metadata into a staging dir
+        Returns: (metadata, staging_dir), or None on failure
+        """
         if source == "marketplace":
-            # Download from marketplace
             if not version:
                 # Get latest version
                 info = self.marketplace.get_component(name)
                 if not info:
                     print(f"Component not found: {name}")
-                    return False
+                    return None
                 version = info['version']
             
-            # Download
             temp_dir = self.plhub_root / "temp" / f"{name}-{version}"
             if not self.marketplace.download(name, version, temp_dir):
-                return False
+                return None
             
-            # Load metadata
             metadata_file = temp_dir / "component.json"
-            metadata = ComponentMetadata.from_dict(json.loads(metadata_file.read_text()))
-            
-        else:
-            # Install from local directory
-            source_dir = Path(source)
-            metadata_file = source_dir / "component.json"
-            
-            if not metadata_file.exists():
-                print(f"No component.json found in {source}")
-                return False
-            
-            metadata = ComponentMetadata.from_dict(json.loads(metadata_file.read_text()))
-            temp_dir = source_dir
+            metadata = ComponentMetadata.from_dict(_json_loads(metadata_file.read_bytes()))
+            return metadata, temp_dir
+        
+        # Install from local directory
+        source_dir = Path(source)
+        metadata_file = source_dir / "component.json"
+        
+        if not metadata_file.exists():
+            print(f"No component.json found in {source}")
+            return None
+        
+        metadata = ComponentMetadata.from_dict(_json_loads(metadata_file.read_bytes()))
+        return metadata, source_dir
+
+    def install(self, name: str, version: Optional[str] = None, 
+               source: str = "marketplace") -> bool:
+        """Install a component"""
+        print(f"Installing {name}" + (f"@{version}" if version else ""))
+        
+        fetched = self._fetch_metadata(name, version, source)
+        if fetched is None:
+            return False
+        metadata, temp_dir = fetched
         
         # Resolve dependencies
         print("Resolving dependencies...")
@@ -522,15 +906,20 @@ class ComponentManager:
                 print(f"  - {error}")
             return False
         
-        # Install dependencies first
-        for dep_meta in deps:
-            if not self.registry.get(dep_meta.name, dep_meta.version):
+        # Install missing dependencies in topological order — one fetch
+        # per dependency, no recursive re-resolution of shared subtrees.
+        # One registry transaction covers the whole install.
+        with self.registry.batch():
+            for dep_meta in self.resolver.get_install_order(deps):
+                if self.registry.get(dep_meta.name, dep_meta.version):
+                    continue
                 print(f"Installing dependency: {dep_meta.name}@{dep_meta.version}")
-                if not self.install(dep_meta.name, dep_meta.version):
+                dep_fetched = self._fetch_metadata(dep_meta.name, dep_meta.version, "marketplace")
+                if dep_fetched is None or not self.registry.register(*dep_fetched):
                     return False
-        
-        # Register component
-        return self.registry.register(metadata, temp_dir)
+            
+            # Register component
+            return self.registry.register(metadata, temp_dir)
     
     def uninstall(self, name: str, version: Optional[str] = None) -> bool:
         """Uninstall a component"""
@@ -563,7 +952,7 @@ class ComponentManager:
         
         latest_version = latest_info['version']
         
-        if semver.compare(latest_version, current.version) <= 0:
+        if Version(latest_version) <= current._ver:
             print(f"Already at latest version: {current.version}")
             return True
         
@@ -578,14 +967,23 @@ class ComponentManager:
     def check_updates(self) -> List[Tuple[str, str, str]]:
         """Check for component updates"""
         updates = []
-        
-        for meta in self.registry.list_components():
-            latest_info = self.marketplace.get_component(meta.name)
-            if latest_info:
-                latest_version = latest_info['version']
-                if semver.compare(latest_version, meta.version) > 0:
-                    updates.append((meta.name, meta.version, latest_version))
-        
+
+        components = self.registry.list_components()
+        if not components:
+            return updates
+
+        # N serial marketplace round-trips collapse to one pool of
+        # concurrent requests over the shared keep-alive session.
+        with ThreadPoolExecutor(max_workers=min(16, len(components))) as executor:
+            infos = executor.map(
+                lambda m: self.marketplace.get_component(m.name), components
+            )
+            for meta, latest_info in zip(components, infos):
+                if latest_info:
+                    latest_version = latest_info['version']
+                    if Version(latest_version) > meta._ver:
+                        updates.append((meta.name, meta.version, latest_version))
+
         return updates
     
     def publish(self, component_dir: Path, api_key: str) -> bool:
@@ -596,7 +994,7 @@ class ComponentManager:
             print("No component.json found")
             return False
         
-        metadata = ComponentMetadata.from_dict(json.loads(metadata_file.read_text()))
+        metadata = ComponentMetadata.from_dict(_json_loads(metadata_file.read_bytes()))
         
         return self.marketplace.publish(component_dir, metadata, api_key)
 
@@ -621,7 +1019,7 @@ def create_component_template(name: str, component_type: ComponentType,
         
         # Write metadata
         metadata_file = component_dir / "component.json"
-        metadata_file.write_text(json.dumps(metadata.to_dict(), indent=2))
+        _atomic_write_bytes(metadata_file, _json_dumps(metadata.to_dict()))
         
         # Create README
         readme = component_dir / "README.md"
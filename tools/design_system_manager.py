@@ -6,14 +6,98 @@ shadows, borders, and generates design system documentation.
 Version: 1.0.0
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Mapping, Optional, Any, Tuple
 from enum import Enum
 import json
 from pathlib import Path
 import colorsys
 import math
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(**_kwargs):
+        def decorate(func):
+            return func
+        return decorate
+
+
+# Self-contained copies of the colorsys HLS algebra so the hot modifier
+# kernels can be JIT-compiled when numba is installed (colorsys itself is
+# not nopython-compatible). Results match colorsys bit for bit.
+
+@njit(cache=True)
+def _rgb_to_hls(r: float, g: float, b: float) -> Tuple[float, float, float]:
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    if minc == maxc:
+        return 0.0, l, 0.0
+    if l <= 0.5:
+        s = rangec / sumc
+    else:
+        s = rangec / (2.0 - maxc - minc)  # Not always 2.0-sumc: gh-106498.
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    if r == maxc:
+        h = bc - gc
+    elif g == maxc:
+        h = 2.0 + rc - bc
+    else:
+        h = 4.0 + gc - rc
+    h = (h / 6.0) % 1.0
+    return h, l, s
+
+
+@njit(cache=True)
+def _hls_channel(m1: float, m2: float, hue: float) -> float:
+    hue = hue % 1.0
+    if hue < 1.0 / 6.0:
+        return m1 + (m2 - m1) * hue * 6.0
+    if hue < 0.5:
+        return m2
+    if hue < 2.0 / 3.0:
+        return m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0
+    return m1
+
+
+@njit(cache=True)
+def _hls_to_rgb(h: float, l: float, s: float) -> Tuple[float, float, float]:
+    if s == 0.0:
+        return l, l, l
+    if l <= 0.5:
+        m2 = l * (1.0 + s)
+    else:
+        m2 = l + s - (l * s)
+    m1 = 2.0 * l - m2
+    return (_hls_channel(m1, m2, h + 1.0 / 3.0),
+            _hls_channel(m1, m2, h),
+            _hls_channel(m1, m2, h - 1.0 / 3.0))
+
+
+# sRGB -> linear RGB lookup table: hex channels only take 256 values, so
+# the per-channel branch and pow(x, 2.4) are paid once at import.
+_SRGB_TO_LIN = tuple(
+    (v / 255.0 / 12.92) if v / 255.0 <= 0.03928 else ((v / 255.0 + 0.055) / 1.055) ** 2.4
+    for v in range(256)
+)
+
 
 class TokenType(Enum):
     """Design token types"""
@@ -29,7 +113,7 @@ class TokenType(Enum):
     BREAKPOINT = "breakpoint"
 
 
-@dataclass
+@dataclass(slots=True)
 class DesignToken:
     """Represents a design token"""
     name: str
@@ -40,7 +124,15 @@ class DesignToken:
     aliases: List[str] = field(default_factory=list)
     deprecated: bool = False
     replacement: Optional[str] = None
-    
+    _css_name: str = field(init=False, repr=False, compare=False)
+    _scss_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Variable names are fixed by the token name; format them once
+        # instead of once per export line.
+        self._css_name = f'--{self.name}'
+        self._scss_name = f'${self.name}'
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
         return {
@@ -69,14 +161,22 @@ class DesignToken:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorToken:
     """Color design token with variants"""
     name: str
     base: str  # Hex color
     variants: Dict[str, str] = field(default_factory=dict)  # lighter, darker, etc.
     description: str = ""
-    
+    _css_names: Dict[str, str] = field(init=False, repr=False, compare=False)
+    _scss_names: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._css_names = {'base': f'--color-{self.name}',
+                           **{v: f'--color-{self.name}-{v}' for v in self.variants}}
+        self._scss_names = {'base': f'$color-{self.name}',
+                            **{v: f'$color-{self.name}-{v}' for v in self.variants}}
+
     def get_variant(self, variant: str) -> str:
         """Get color variant"""
         return self.variants.get(variant, self.base)
@@ -91,7 +191,7 @@ class ColorToken:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TypographyScale:
     """Typography scale system"""
     base_size: int = 16  # Base font size in pixels
@@ -105,30 +205,51 @@ class TypographyScale:
         'semibold': 600,
         'bold': 700
     })
-    
+    _size_cache: Optional[Dict[int, int]] = field(init=False, repr=False, compare=False, default=None)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any attribute change invalidates the precomputed sizes
+        if name != '_size_cache':
+            object.__setattr__(self, '_size_cache', None)
+
     def get_size(self, step: int) -> int:
         """Get font size for scale step"""
-        return round(self.base_size * (self.scale_ratio ** step))
-    
+        cache = self._size_cache
+        if cache is None:
+            # Precompute the sizes for the steps generate_scale actually uses,
+            # so repeated scale generation skips the ** and round() per lookup.
+            cache = {
+                s: round(self.base_size * (self.scale_ratio ** s))
+                for s in range(-4, 8)
+            }
+            self._size_cache = cache
+        size = cache.get(step)
+        if size is None:
+            size = round(self.base_size * (self.scale_ratio ** step))
+        return size
+
     def get_line_height(self, step: int) -> int:
         """Get line height for scale step"""
         size = self.get_size(step)
         return round(size * self.line_height_ratio)
     
+    _SCALE_MAP: ClassVar[Mapping[str, int]] = MappingProxyType({
+        'xs': -2,
+        'sm': -1,
+        'base': 0,
+        'lg': 1,
+        'xl': 2,
+        '2xl': 3,
+        '3xl': 4,
+        '4xl': 5,
+        '5xl': 6
+    })
+
     def generate_scale(self, steps: List[str]) -> Dict[str, Dict]:
         """Generate typography scale"""
-        scale_map = {
-            'xs': -2,
-            'sm': -1,
-            'base': 0,
-            'lg': 1,
-            'xl': 2,
-            '2xl': 3,
-            '3xl': 4,
-            '4xl': 5,
-            '5xl': 6
-        }
-        
+        scale_map = self._SCALE_MAP
+
         result = {}
         for name in steps:
             step = scale_map.get(name, 0)
@@ -144,7 +265,7 @@ class TypographyScale:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class SpacingScale:
     """Spacing scale system"""
     base_unit: int = 4  # Base spacing unit in pixels
@@ -156,9 +277,13 @@ class SpacingScale:
             return self.base_unit * self.scale_values[step]
         return self.base_unit * step
     
+    _SCALE_NAMES: ClassVar[Tuple[str, ...]] = (
+        '0', '1', '2', '3', '4', '6', '8', '12', '16', '24', '32', '48', '64'
+    )
+
     def generate_scale(self) -> Dict[str, str]:
         """Generate spacing scale"""
-        names = ['0', '1', '2', '3', '4', '6', '8', '12', '16', '24', '32', '48', '64']
+        names = self._SCALE_NAMES
         result = {}
         
         for i, value in enumerate(self.scale_values):
@@ -168,7 +293,7 @@ class SpacingScale:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ShadowToken:
     """Shadow design token"""
     name: str
@@ -178,19 +303,27 @@ class ShadowToken:
     spread: int
     color: str
     opacity: float = 0.1
-    
+    _css_cache: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any attribute change invalidates the rendered CSS string
+        if name != '_css_cache':
+            object.__setattr__(self, '_css_cache', None)
+
     def to_css(self) -> str:
         """Convert to CSS shadow string"""
-        rgba = self._hex_to_rgba(self.color, self.opacity)
-        return f'{self.x_offset}px {self.y_offset}px {self.blur}px {self.spread}px {rgba}'
+        css = self._css_cache
+        if css is None:
+            rgba = self._hex_to_rgba(self.color, self.opacity)
+            css = f'{self.x_offset}px {self.y_offset}px {self.blur}px {self.spread}px {rgba}'
+            self._css_cache = css
+        return css
     
     def _hex_to_rgba(self, hex_color: str, alpha: float) -> str:
         """Convert hex to rgba"""
-        hex_color = hex_color.lstrip('#')
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return f'rgba({r}, {g}, {b}, {alpha})'
+        v = int(hex_color.lstrip('#'), 16)
+        return f'rgba({(v >> 16) & 0xFF}, {(v >> 8) & 0xFF}, {v & 0xFF}, {alpha})'
     
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -206,19 +339,67 @@ class ShadowToken:
         }
 
 
+class _ColorArray:
+    """Structure-of-arrays color batch.
+
+    Channels are kept as parallel H/L/S lists (degree/percent space) so a
+    whole batch can be modified and recomposed in one pass; hex strings
+    exist only at the boundary.
+    """
+
+    __slots__ = ('h', 'l', 's')
+
+    def __init__(self, h: List[float], l: List[float], s: List[float]):
+        self.h = h
+        self.l = l
+        self.s = s
+
+    @classmethod
+    def from_hex(cls, hex_list: List[str]) -> '_ColorArray':
+        """Decompose a list of hex colors once into H/L/S arrays"""
+        hs, ls, ss = [], [], []
+        for hex_color in hex_list:
+            v = int(hex_color.lstrip('#'), 16)
+            h, l, s = _rgb_to_hls(((v >> 16) & 0xFF) / 255.0,
+                                  ((v >> 8) & 0xFF) / 255.0,
+                                  (v & 0xFF) / 255.0)
+            hs.append(h * 360)
+            ls.append(l * 100)
+            ss.append(s * 100)
+        return cls(hs, ls, ss)
+
+    def apply_hsl_delta(self, dh: float = 0.0, ds: float = 0.0, dl: float = 0.0) -> '_ColorArray':
+        """Apply uniform deltas to every color in the batch, in place"""
+        if dh:
+            self.h = [(h + dh) % 360 for h in self.h]
+        if ds:
+            self.s = [min(100.0, max(0.0, s + ds)) for s in self.s]
+        if dl:
+            self.l = [min(100.0, max(0.0, l + dl)) for l in self.l]
+        return self
+
+    def to_hex(self) -> List[str]:
+        """Recompose the batch into hex strings"""
+        results = []
+        for h, l, s in zip(self.h, self.l, self.s):
+            r, g, b = _hls_to_rgb(h / 360.0, l / 100.0, s / 100.0)
+            results.append(f'#{(int(r * 255) << 16) | (int(g * 255) << 8) | int(b * 255):06x}')
+        return results
+
+
 class ColorPalette:
     """Color palette generator and utilities"""
     
     @staticmethod
     def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         """Convert hex to RGB"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    
+        v = int(hex_color.lstrip('#'), 16)
+        return ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
+
     @staticmethod
     def rgb_to_hex(r: int, g: int, b: int) -> str:
         """Convert RGB to hex"""
-        return f'#{r:02x}{g:02x}{b:02x}'
+        return f'#{(r << 16) | (g << 8) | b:06x}'
     
     @staticmethod
     def hex_to_hsl(hex_color: str) -> Tuple[float, float, float]:
@@ -236,61 +417,90 @@ class ColorPalette:
         r, g, b = int(r * 255), int(g * 255), int(b * 255)
         return ColorPalette.rgb_to_hex(r, g, b)
     
+    @staticmethod
+    def _apply_hsl_delta(hex_color: str, dh: float = 0.0, ds: float = 0.0, dl: float = 0.0) -> str:
+        """Apply hue/saturation/lightness deltas with one decompose/recompose"""
+        v = int(hex_color.lstrip('#'), 16)
+        h, l, s = _rgb_to_hls(((v >> 16) & 0xFF) / 255.0,
+                              ((v >> 8) & 0xFF) / 255.0,
+                              (v & 0xFF) / 255.0)
+        # Deltas are applied in degree/percent space to match hex_to_hsl /
+        # hsl_to_hex bit-for-bit.
+        h = ((h * 360 + dh) % 360) / 360.0
+        s = min(100.0, max(0.0, s * 100 + ds)) / 100.0
+        l = min(100.0, max(0.0, l * 100 + dl)) / 100.0
+        r, g, b = _hls_to_rgb(h, l, s)
+        return f'#{(int(r * 255) << 16) | (int(g * 255) << 8) | int(b * 255):06x}'
+
+    @staticmethod
+    def _batch_hue_rotate(hex_color: str, degrees_list: List[float]) -> List[str]:
+        """Rotate hue by each angle in degrees_list, decomposing only once"""
+        v = int(hex_color.lstrip('#'), 16)
+        h, l, s = _rgb_to_hls(((v >> 16) & 0xFF) / 255.0,
+                              ((v >> 8) & 0xFF) / 255.0,
+                              (v & 0xFF) / 255.0)
+        # Same degree/percent round-trip as _apply_hsl_delta for exact
+        # agreement with adjust_hue.
+        l = l * 100 / 100.0
+        s = s * 100 / 100.0
+        results = []
+        for degrees in degrees_list:
+            r, g, b = _hls_to_rgb(((h * 360 + degrees) % 360) / 360.0, l, s)
+            results.append(f'#{(int(r * 255) << 16) | (int(g * 255) << 8) | int(b * 255):06x}')
+        return results
+
     @staticmethod
     def lighten(hex_color: str, amount: float) -> str:
         """Lighten color by percentage (0-100)"""
-        h, s, l = ColorPalette.hex_to_hsl(hex_color)
-        l = min(100, l + amount)
-        return ColorPalette.hsl_to_hex(h, s, l)
-    
+        return ColorPalette._apply_hsl_delta(hex_color, dl=amount)
+
     @staticmethod
     def darken(hex_color: str, amount: float) -> str:
         """Darken color by percentage (0-100)"""
-        h, s, l = ColorPalette.hex_to_hsl(hex_color)
-        l = max(0, l - amount)
-        return ColorPalette.hsl_to_hex(h, s, l)
-    
+        return ColorPalette._apply_hsl_delta(hex_color, dl=-amount)
+
     @staticmethod
     def saturate(hex_color: str, amount: float) -> str:
         """Increase saturation by percentage"""
-        h, s, l = ColorPalette.hex_to_hsl(hex_color)
-        s = min(100, s + amount)
-        return ColorPalette.hsl_to_hex(h, s, l)
-    
+        return ColorPalette._apply_hsl_delta(hex_color, ds=amount)
+
     @staticmethod
     def desaturate(hex_color: str, amount: float) -> str:
         """Decrease saturation by percentage"""
-        h, s, l = ColorPalette.hex_to_hsl(hex_color)
-        s = max(0, s - amount)
-        return ColorPalette.hsl_to_hex(h, s, l)
-    
+        return ColorPalette._apply_hsl_delta(hex_color, ds=-amount)
+
     @staticmethod
     def adjust_hue(hex_color: str, degrees: float) -> str:
         """Rotate hue by degrees"""
-        h, s, l = ColorPalette.hex_to_hsl(hex_color)
-        h = (h + degrees) % 360
-        return ColorPalette.hsl_to_hex(h, s, l)
+        return ColorPalette._apply_hsl_delta(hex_color, dh=degrees)
     
+    @staticmethod
+    def _generate_palette_split(base_color: str, steps: int = 10) -> Tuple[str, Dict[str, str]]:
+        """Generate a palette as (base, variants) without the '500' entry"""
+        # Decompose the base color once, build every shade's lightness as a
+        # batch and convert back to hex only at the boundary.
+        h, s, l = ColorPalette.hex_to_hsl(base_color)
+        half = steps // 2
+        spread = 100 / (half + 1)
+
+        keys = [f'{(half - i - 1) * 100}' for i in range(half)]
+        ls = [min(100, l + (i + 1) * spread) for i in range(half)]
+        keys += [f'{(half + i + 1) * 100}' for i in range(half)]
+        ls += [max(0, l - (i + 1) * spread) for i in range(half)]
+
+        shades = _ColorArray([h] * len(ls), ls, [s] * len(ls)).to_hex()
+        return base_color, dict(zip(keys, shades))
+
     @staticmethod
     def generate_palette(base_color: str, steps: int = 10) -> Dict[str, str]:
         """Generate color palette from base color"""
-        palette = {}
-        
-        # Generate lighter shades
-        for i in range(steps // 2):
-            step = (i + 1) * (100 / (steps // 2 + 1))
-            key = f'{(steps // 2 - i - 1) * 100}'
-            palette[key] = ColorPalette.lighten(base_color, step)
-        
-        # Base color
-        palette['500'] = base_color
-        
-        # Generate darker shades
-        for i in range(steps // 2):
-            step = (i + 1) * (100 / (steps // 2 + 1))
-            key = f'{(steps // 2 + i + 1) * 100}'
-            palette[key] = ColorPalette.darken(base_color, step)
-        
+        base, variants = ColorPalette._generate_palette_split(base_color, steps)
+        half = len(variants) // 2
+        items = list(variants.items())
+
+        palette = dict(items[:half])
+        palette['500'] = base
+        palette.update(items[half:])
         return palette
     
     @staticmethod
@@ -301,43 +511,45 @@ class ColorPalette:
     @staticmethod
     def generate_triadic(hex_color: str) -> List[str]:
         """Generate triadic color scheme"""
-        return [
-            hex_color,
-            ColorPalette.adjust_hue(hex_color, 120),
-            ColorPalette.adjust_hue(hex_color, 240)
-        ]
-    
+        return [hex_color] + ColorPalette._batch_hue_rotate(hex_color, [120, 240])
+
     @staticmethod
     def generate_analogous(hex_color: str, angle: float = 30) -> List[str]:
         """Generate analogous color scheme"""
-        return [
-            ColorPalette.adjust_hue(hex_color, -angle),
-            hex_color,
-            ColorPalette.adjust_hue(hex_color, angle)
-        ]
+        rotated = ColorPalette._batch_hue_rotate(hex_color, [-angle, angle])
+        return [rotated[0], hex_color, rotated[1]]
     
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _luminance(hex_color: str) -> float:
+        """Relative luminance of a hex color (WCAG definition)"""
+        v = int(hex_color.lstrip('#'), 16)
+        return (0.2126 * _SRGB_TO_LIN[(v >> 16) & 0xFF]
+                + 0.7152 * _SRGB_TO_LIN[(v >> 8) & 0xFF]
+                + 0.0722 * _SRGB_TO_LIN[v & 0xFF])
+
     @staticmethod
     def get_contrast_ratio(color1: str, color2: str) -> float:
         """Calculate WCAG contrast ratio between two colors"""
-        def get_luminance(hex_color: str) -> float:
-            r, g, b = ColorPalette.hex_to_rgb(hex_color)
-            r, g, b = r / 255.0, g / 255.0, b / 255.0
-            
-            # sRGB to linear RGB
-            r = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-            g = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-            b = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
-            
-            return 0.2126 * r + 0.7152 * g + 0.0722 * b
-        
-        l1 = get_luminance(color1)
-        l2 = get_luminance(color2)
-        
+        l1 = ColorPalette._luminance(color1)
+        l2 = ColorPalette._luminance(color2)
+
         lighter = max(l1, l2)
         darker = min(l1, l2)
-        
+
         return (lighter + 0.05) / (darker + 0.05)
     
+    @staticmethod
+    def contrast_matrix(hex_list: List[str]) -> List[List[float]]:
+        """Pairwise WCAG contrast ratios for a list of colors"""
+        # Luminance is computed once per color instead of once per pair,
+        # so the N^2 inner loop is just a max/min and a division.
+        lums = [ColorPalette._luminance(c) + 0.05 for c in hex_list]
+        return [
+            [max(la, lb) / min(la, lb) for lb in lums]
+            for la in lums
+        ]
+
     @staticmethod
     def meets_wcag_aa(color1: str, color2: str, large_text: bool = False) -> bool:
         """Check if color combination meets WCAG AA standards"""
@@ -352,6 +564,18 @@ class ColorPalette:
         threshold = 4.5 if large_text else 7.0
         return ratio >= threshold
 
+    @staticmethod
+    def check_wcag(color1: str, color2: str) -> Dict[str, Any]:
+        """Compute the contrast ratio and all WCAG flags in one pass"""
+        ratio = ColorPalette.get_contrast_ratio(color1, color2)
+        return {
+            'ratio': ratio,
+            'aa_normal': ratio >= 4.5,
+            'aa_large': ratio >= 3.0,
+            'aaa_normal': ratio >= 7.0,
+            'aaa_large': ratio >= 4.5
+        }
+
 
 class DesignSystemManager:
     """Manages design tokens and generates design system documentation"""
@@ -362,7 +586,12 @@ class DesignSystemManager:
         self.typography_scale = TypographyScale()
         self.spacing_scale = SpacingScale()
         self.shadows: Dict[str, ShadowToken] = {}
-        
+        self._alias_index: Dict[str, DesignToken] = {}
+
+        # Generated-token caches; rebuilt lazily after invalidation
+        self._typography_cache: Optional[Dict[str, Any]] = None
+        self._spacing_cache: Optional[Dict[str, str]] = None
+
         # Initialize default tokens
         self._init_default_tokens()
     
@@ -419,6 +648,10 @@ class DesignSystemManager:
     def add_token(self, token: DesignToken):
         """Add design token"""
         self.tokens[token.name] = token
+        for alias in token.aliases:
+            self._alias_index[alias] = token
+        if token.type in (TokenType.TYPOGRAPHY, TokenType.SPACING):
+            self.invalidate_scale_caches()
     
     def add_color_token(self, color_token: ColorToken):
         """Add color token"""
@@ -430,16 +663,8 @@ class DesignSystemManager:
     
     def get_token(self, name: str) -> Optional[DesignToken]:
         """Get design token by name or alias"""
-        # Check direct name
-        if name in self.tokens:
-            return self.tokens[name]
-        
-        # Check aliases
-        for token in self.tokens.values():
-            if name in token.aliases:
-                return token
-        
-        return None
+        # Direct name, then the alias index maintained by add_token
+        return self.tokens.get(name) or self._alias_index.get(name)
     
     def get_color(self, name: str, variant: Optional[str] = None) -> Optional[str]:
         """Get color value"""
@@ -450,13 +675,10 @@ class DesignSystemManager:
     
     def generate_color_palette(self, name: str, base_color: str, steps: int = 10):
         """Generate and add color palette"""
-        palette = ColorPalette.generate_palette(base_color, steps)
-        
-        variants = {}
-        for key, color in palette.items():
-            if key != '500':
-                variants[key] = color
-        
+        # The split generator skips the '500' round-trip the public
+        # generate_palette keeps for external callers.
+        base_color, variants = ColorPalette._generate_palette_split(base_color, steps)
+
         self.add_color_token(ColorToken(
             name=name,
             base=base_color,
@@ -464,150 +686,197 @@ class DesignSystemManager:
             description=f'Generated palette for {name}'
         ))
     
+    def invalidate_scale_caches(self):
+        """Drop cached generated tokens after a scale mutation"""
+        self._typography_cache = None
+        self._spacing_cache = None
+
     def generate_typography_tokens(self) -> Dict[str, Any]:
         """Generate typography tokens"""
+        # Pure function of the typography scale; export_tokens and the
+        # documentation generators all call it, so cache the result.
+        if self._typography_cache is not None:
+            return self._typography_cache
+
         scale = self.typography_scale.generate_scale([
             'xs', 'sm', 'base', 'lg', 'xl', '2xl', '3xl', '4xl', '5xl'
         ])
-        
+
         tokens = {}
         for name, value in scale.items():
             tokens[f'typography-{name}'] = value
-        
+
         # Add font weights
         for name, weight in self.typography_scale.font_weights.items():
             tokens[f'font-weight-{name}'] = weight
-        
+
+        self._typography_cache = tokens
         return tokens
-    
+
     def generate_spacing_tokens(self) -> Dict[str, str]:
         """Generate spacing tokens"""
+        if self._spacing_cache is not None:
+            return self._spacing_cache
+
         scale = self.spacing_scale.generate_scale()
-        
+
         tokens = {}
         for name, value in scale.items():
             tokens[f'spacing-{name}'] = value
-        
+
+        self._spacing_cache = tokens
         return tokens
     
     def validate_accessibility(self, foreground: str, background: str) -> Dict:
         """Validate color contrast for accessibility"""
-        ratio = ColorPalette.get_contrast_ratio(foreground, background)
-        
+        result = ColorPalette.check_wcag(foreground, background)
+
         return {
-            'ratio': round(ratio, 2),
-            'wcag_aa_normal': ColorPalette.meets_wcag_aa(foreground, background, False),
-            'wcag_aa_large': ColorPalette.meets_wcag_aa(foreground, background, True),
-            'wcag_aaa_normal': ColorPalette.meets_wcag_aaa(foreground, background, False),
-            'wcag_aaa_large': ColorPalette.meets_wcag_aaa(foreground, background, True)
+            'ratio': round(result['ratio'], 2),
+            'wcag_aa_normal': result['aa_normal'],
+            'wcag_aa_large': result['aa_large'],
+            'wcag_aaa_normal': result['aaa_normal'],
+            'wcag_aaa_large': result['aaa_large']
         }
     
     def export_tokens(self, filepath: Path, format: str = 'json'):
         """Export tokens to file"""
-        data = {
-            'tokens': {name: token.to_dict() for name, token in self.tokens.items()},
-            'colors': {name: color.to_dict() for name, color in self.color_tokens.items()},
-            'shadows': {name: shadow.to_dict() for name, shadow in self.shadows.items()},
-            'typography': self.generate_typography_tokens(),
-            'spacing': self.generate_spacing_tokens()
-        }
-        
         if format == 'json':
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Shadows keep their to_dict because 'value' (the rendered CSS
+            # string) is computed rather than stored as a field.
+            shadows = {name: shadow.to_dict() for name, shadow in self.shadows.items()}
+            if ORJSON_AVAILABLE:
+                # orjson walks dataclasses natively (field order matches
+                # to_dict, underscore fields are skipped, enums serialize
+                # by value), so the per-token dict copies are not needed.
+                data = {
+                    'tokens': self.tokens,
+                    'colors': self.color_tokens,
+                    'shadows': shadows,
+                    'typography': self.generate_typography_tokens(),
+                    'spacing': self.generate_spacing_tokens()
+                }
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                data = {
+                    'tokens': {name: token.to_dict() for name, token in self.tokens.items()},
+                    'colors': {name: color.to_dict() for name, color in self.color_tokens.items()},
+                    'shadows': shadows,
+                    'typography': self.generate_typography_tokens(),
+                    'spacing': self.generate_spacing_tokens()
+                }
+                with open(filepath, 'w') as f:
+                    json.dump(data, f, indent=2)
         elif format == 'css':
-            self._export_css(filepath, data)
+            self._export_css(filepath)
         elif format == 'scss':
-            self._export_scss(filepath, data)
+            self._export_scss(filepath)
     
-    def _export_css(self, filepath: Path, data: Dict):
-        """Export as CSS custom properties"""
-        lines = [':root {']
-        
-        # Colors
-        for name, color in data['colors'].items():
-            lines.append(f'  --color-{name}: {color["base"]};')
-            for variant, value in color.get('variants', {}).items():
-                lines.append(f'  --color-{name}-{variant}: {value};')
-        
-        # Shadows
-        for name, shadow in data['shadows'].items():
-            lines.append(f'  --shadow-{name}: {shadow["value"]};')
-        
-        # Typography
-        for name, value in data['typography'].items():
+    @staticmethod
+    def _split_typography(typography: Dict) -> Tuple[List[Tuple[str, Dict]], List[Tuple[str, Any]]]:
+        """Partition typography entries once so the write loops are branch-free"""
+        scale_items, flat_items = [], []
+        for name, value in typography.items():
             if isinstance(value, dict):
-                lines.append(f'  --{name}-size: {value.get("fontSize", "")};')
-                lines.append(f'  --{name}-line-height: {value.get("lineHeight", "")};')
+                scale_items.append((name, value))
             else:
-                lines.append(f'  --{name}: {value};')
-        
-        # Spacing
-        for name, value in data['spacing'].items():
-            lines.append(f'  --{name}: {value};')
-        
-        # Other tokens
-        for name, token in data['tokens'].items():
-            lines.append(f'  --{name}: {token["value"]};')
-        
-        lines.append('}')
-        
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
-    
-    def _export_scss(self, filepath: Path, data: Dict):
+                flat_items.append((name, value))
+        return scale_items, flat_items
+
+    def _export_css(self, filepath: Path):
+        """Export as CSS custom properties"""
+        # Stream lines straight to the buffered file instead of collecting
+        # them in a list and joining a second copy in memory. Variable
+        # names come precomputed from the token objects.
+        with open(filepath, 'w', buffering=1 << 16) as f:
+            write = f.write
+            write(':root {\n')
+
+            # Colors
+            for color in self.color_tokens.values():
+                names = color._css_names
+                write(f'  {names["base"]}: {color.base};\n')
+                for variant, value in color.variants.items():
+                    prefix = names.get(variant) or f'--color-{color.name}-{variant}'
+                    write(f'  {prefix}: {value};\n')
+
+            # Shadows
+            for name, shadow in self.shadows.items():
+                write(f'  --shadow-{name}: {shadow.to_css()};\n')
+
+            # Typography
+            scale_items, flat_items = self._split_typography(self.generate_typography_tokens())
+            for name, value in scale_items:
+                write(f'  --{name}-size: {value.get("fontSize", "")};\n')
+                write(f'  --{name}-line-height: {value.get("lineHeight", "")};\n')
+            for name, value in flat_items:
+                write(f'  --{name}: {value};\n')
+
+            # Spacing
+            for name, value in self.generate_spacing_tokens().items():
+                write(f'  --{name}: {value};\n')
+
+            # Other tokens
+            for token in self.tokens.values():
+                write(f'  {token._css_name}: {token.value};\n')
+
+            write('}')
+
+    def _export_scss(self, filepath: Path):
         """Export as SCSS variables"""
-        lines = []
-        
-        # Colors
-        for name, color in data['colors'].items():
-            lines.append(f'$color-{name}: {color["base"]};')
-            for variant, value in color.get('variants', {}).items():
-                lines.append(f'$color-{name}-{variant}: {value};')
-        
-        lines.append('')
-        
-        # Shadows
-        for name, shadow in data['shadows'].items():
-            lines.append(f'$shadow-{name}: {shadow["value"]};')
-        
-        lines.append('')
-        
-        # Typography
-        for name, value in data['typography'].items():
-            if isinstance(value, dict):
-                lines.append(f'${name}-size: {value.get("fontSize", "")};')
-                lines.append(f'${name}-line-height: {value.get("lineHeight", "")};')
-            else:
-                lines.append(f'${name}: {value};')
-        
-        lines.append('')
-        
-        # Spacing
-        for name, value in data['spacing'].items():
-            lines.append(f'${name}: {value};')
-        
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
+        with open(filepath, 'w', buffering=1 << 16) as f:
+            write = f.write
+
+            # Colors
+            for color in self.color_tokens.values():
+                names = color._scss_names
+                write(f'{names["base"]}: {color.base};\n')
+                for variant, value in color.variants.items():
+                    prefix = names.get(variant) or f'$color-{color.name}-{variant}'
+                    write(f'{prefix}: {value};\n')
+
+            write('\n')
+
+            # Shadows
+            for name, shadow in self.shadows.items():
+                write(f'$shadow-{name}: {shadow.to_css()};\n')
+
+            write('\n')
+
+            # Typography
+            scale_items, flat_items = self._split_typography(self.generate_typography_tokens())
+            for name, value in scale_items:
+                write(f'${name}-size: {value.get("fontSize", "")};\n')
+                write(f'${name}-line-height: {value.get("lineHeight", "")};\n')
+            for name, value in flat_items:
+                write(f'${name}: {value};\n')
+
+            write('\n')
+
+            # Spacing
+            write('\n'.join(f'${name}: {value};' for name, value in self.generate_spacing_tokens().items()))
     
     def generate_documentation(self, output_dir: Path):
         """Generate design system documentation"""
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Generate index
-        self._generate_index_page(output_dir / 'index.md')
-        
-        # Generate color documentation
-        self._generate_color_docs(output_dir / 'colors.md')
-        
-        # Generate typography documentation
-        self._generate_typography_docs(output_dir / 'typography.md')
-        
-        # Generate spacing documentation
-        self._generate_spacing_docs(output_dir / 'spacing.md')
-        
-        # Generate shadow documentation
-        self._generate_shadow_docs(output_dir / 'shadows.md')
+
+        # Warm the generated-token caches so the workers only read state
+        self.generate_typography_tokens()
+        self.generate_spacing_tokens()
+
+        # The five pages are independent files; write them concurrently so
+        # formatting and file I/O overlap.
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(self._generate_index_page, output_dir / 'index.md'),
+                executor.submit(self._generate_color_docs, output_dir / 'colors.md'),
+                executor.submit(self._generate_typography_docs, output_dir / 'typography.md'),
+                executor.submit(self._generate_spacing_docs, output_dir / 'spacing.md'),
+                executor.submit(self._generate_shadow_docs, output_dir / 'shadows.md'),
+            ]
+            for future in futures:
+                future.result()
     
     def _generate_index_page(self, filepath: Path):
         """Generate index documentation page"""
@@ -666,72 +935,69 @@ Generated by PLHub Design System Manager
     
     def _generate_color_docs(self, filepath: Path):
         """Generate color documentation"""
-        lines = ['# Color Tokens\n']
-        
-        for name, color in self.color_tokens.items():
-            lines.append(f'## {name.capitalize()}\n')
-            lines.append(f'**Description**: {color.description}\n')
-            lines.append(f'**Base**: `{color.base}`\n')
-            
-            if color.variants:
-                lines.append('\n**Variants**:\n')
-                for variant, value in color.variants.items():
-                    lines.append(f'- `{variant}`: `{value}`')
-            
-            lines.append('\n')
-        
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
-    
+        # Documentation pages stream each line to a buffered handle rather
+        # than collecting a list and joining a second full copy.
+        with open(filepath, 'w', buffering=1 << 16) as f:
+            write = f.write
+            write('# Color Tokens\n')
+
+            for name, color in self.color_tokens.items():
+                write(f'\n## {name.capitalize()}\n')
+                write(f'\n**Description**: {color.description}\n')
+                write(f'\n**Base**: `{color.base}`\n')
+
+                if color.variants:
+                    write('\n\n**Variants**:\n')
+                    for variant, value in color.variants.items():
+                        write(f'\n- `{variant}`: `{value}`')
+
+                write('\n\n')
+
     def _generate_typography_docs(self, filepath: Path):
         """Generate typography documentation"""
         tokens = self.generate_typography_tokens()
-        
-        lines = ['# Typography Tokens\n']
-        lines.append(f'**Base Size**: {self.typography_scale.base_size}px\n')
-        lines.append(f'**Scale Ratio**: {self.typography_scale.scale_ratio}\n')
-        lines.append(f'**Font Family**: {self.typography_scale.font_family}\n\n')
-        
-        lines.append('## Type Scale\n')
-        for name, value in tokens.items():
-            if 'typography' in name and isinstance(value, dict):
-                lines.append(f'### {name}\n')
-                lines.append(f'- Font Size: `{value.get("fontSize")}`')
-                lines.append(f'- Line Height: `{value.get("lineHeight")}`\n')
-        
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
-    
+
+        with open(filepath, 'w', buffering=1 << 16) as f:
+            write = f.write
+            write('# Typography Tokens\n')
+            write(f'\n**Base Size**: {self.typography_scale.base_size}px\n')
+            write(f'\n**Scale Ratio**: {self.typography_scale.scale_ratio}\n')
+            write(f'\n**Font Family**: {self.typography_scale.font_family}\n\n')
+
+            write('\n## Type Scale\n')
+            for name, value in tokens.items():
+                if 'typography' in name and isinstance(value, dict):
+                    write(f'\n### {name}\n')
+                    write(f'\n- Font Size: `{value.get("fontSize")}`')
+                    write(f'\n- Line Height: `{value.get("lineHeight")}`\n')
+
     def _generate_spacing_docs(self, filepath: Path):
         """Generate spacing documentation"""
         tokens = self.generate_spacing_tokens()
-        
-        lines = ['# Spacing Tokens\n']
-        lines.append(f'**Base Unit**: {self.spacing_scale.base_unit}px\n\n')
-        
-        lines.append('## Spacing Scale\n')
-        for name, value in tokens.items():
-            lines.append(f'- `{name}`: `{value}`')
-        
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
-    
+
+        with open(filepath, 'w', buffering=1 << 16) as f:
+            write = f.write
+            write('# Spacing Tokens\n')
+            write(f'\n**Base Unit**: {self.spacing_scale.base_unit}px\n\n')
+
+            write('\n## Spacing Scale\n')
+            f.writelines(f'\n- `{name}`: `{value}`' for name, value in tokens.items())
+
     def _generate_shadow_docs(self, filepath: Path):
         """Generate shadow documentation"""
-        lines = ['# Shadow Tokens\n']
-        
-        for name, shadow in self.shadows.items():
-            lines.append(f'## {name}\n')
-            lines.append(f'**CSS**: `{shadow.to_css()}`\n')
-            lines.append(f'- X Offset: {shadow.x_offset}px')
-            lines.append(f'- Y Offset: {shadow.y_offset}px')
-            lines.append(f'- Blur: {shadow.blur}px')
-            lines.append(f'- Spread: {shadow.spread}px')
-            lines.append(f'- Color: {shadow.color}')
-            lines.append(f'- Opacity: {shadow.opacity}\n')
-        
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(lines))
+        with open(filepath, 'w', buffering=1 << 16) as f:
+            write = f.write
+            write('# Shadow Tokens\n')
+
+            for name, shadow in self.shadows.items():
+                write(f'\n## {name}\n')
+                write(f'\n**CSS**: `{shadow.to_css()}`\n')
+                write(f'\n- X Offset: {shadow.x_offset}px')
+                write(f'\n- Y Offset: {shadow.y_offset}px')
+                write(f'\n- Blur: {shadow.blur}px')
+                write(f'\n- Spread: {shadow.spread}px')
+                write(f'\n- Color: {shadow.color}')
+                write(f'\n- Opacity: {shadow.opacity}\n')
 
 
 # Example usage
@@ -5,12 +5,45 @@ and advanced positioning capabilities for building sophisticated UI layouts.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 import json
+import threading
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+# (prefix, template) pairs for the spacing utility classes, hoisted out
+# of the generator loop.
+_SPACING_TEMPLATES = (
+    ('m', 'margin: {v}px'),
+    ('mt', 'margin-top: {v}px'),
+    ('mr', 'margin-right: {v}px'),
+    ('mb', 'margin-bottom: {v}px'),
+    ('ml', 'margin-left: {v}px'),
+    ('mx', 'margin-left: {v}px; margin-right: {v}px'),
+    ('my', 'margin-top: {v}px; margin-bottom: {v}px'),
+    ('p', 'padding: {v}px'),
+    ('pt', 'padding-top: {v}px'),
+    ('pr', 'padding-right: {v}px'),
+    ('pb', 'padding-bottom: {v}px'),
+    ('pl', 'padding-left: {v}px'),
+    ('px', 'padding-left: {v}px; padding-right: {v}px'),
+    ('py', 'padding-top: {v}px; padding-bottom: {v}px'),
+    ('gap', 'gap: {v}px'),
+)
+
+# Parsed layout configs keyed by (path, mtime_ns); a config is only
+# re-parsed when the file changes on disk
+_CONFIG_CACHE: Dict[Tuple[str, int], 'LayoutConfig'] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
 class Breakpoint:
     """Represents a responsive breakpoint"""
     name: str
@@ -21,7 +54,7 @@ class Breakpoint:
     margin: int = 16
 
 
-@dataclass
+@dataclass(slots=True)
 class GridConfig:
     """Grid system configuration"""
     columns: int = 12
@@ -38,7 +71,7 @@ class GridConfig:
             }
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutConfig:
     """Complete layout configuration"""
     breakpoints: List[Breakpoint]
@@ -92,29 +125,58 @@ class LayoutManager:
                 spacing_scale=self.DEFAULT_SPACING,
                 z_index_scale=self.DEFAULT_Z_INDEX
             )
+        self._config_version = 0
+        self._cache: Dict[str, Tuple[int, Dict]] = {}
+        self._rebuild_breakpoint_index()
+
+    def _rebuild_breakpoint_index(self) -> None:
+        """Rebuild the name -> breakpoint index after breakpoints change"""
+        self._bp_index = {bp.name: bp for bp in self.config.breakpoints}
+        self._config_version += 1
+
+    def _cached(self, key: str, build: Callable[[], Dict]) -> Dict:
+        """Return build()'s result cached against the current config version"""
+        version = self._config_version
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        result = build()
+        self._cache[key] = (version, result)
+        return result
     
     def _load_config(self, path: Path) -> LayoutConfig:
         """Load layout configuration from JSON file"""
+        # The config is never mutated after construction, so parsed configs
+        # can be shared between managers until the file changes on disk
+        key = (str(path), path.stat().st_mtime_ns)
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached
+
         with open(path, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        
+
         breakpoints = [
             Breakpoint(**bp) for bp in data.get('breakpoints', [])
         ]
-        
+
         grid_data = data.get('grid', {})
         grid = GridConfig(
             columns=grid_data.get('columns', 12),
             gutter=grid_data.get('gutter', 16),
             container_max_width=grid_data.get('container_max_width')
         )
-        
-        return LayoutConfig(
+
+        config = LayoutConfig(
             breakpoints=breakpoints,
             grid=grid,
             spacing_scale=data.get('spacing_scale', self.DEFAULT_SPACING),
             z_index_scale=data.get('z_index_scale', self.DEFAULT_Z_INDEX)
         )
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[key] = config
+        return config
     
     def save_config(self, path: Path) -> None:
         """Save layout configuration to JSON file"""
@@ -145,10 +207,7 @@ class LayoutManager:
     
     def get_breakpoint(self, name: str) -> Optional[Breakpoint]:
         """Get breakpoint configuration by name"""
-        for bp in self.config.breakpoints:
-            if bp.name == name:
-                return bp
-        return None
+        return self._bp_index.get(name)
     
     def calculate_column_width(self, columns: int, breakpoint: str = 'desktop') -> float:
         """Calculate column width percentage for grid system"""
@@ -160,46 +219,46 @@ class LayoutManager:
     
     def generate_grid_classes(self) -> Dict[str, str]:
         """Generate CSS-like grid classes for all breakpoints"""
+        return self._cached('grid', self._build_grid_classes)
+
+    def _build_grid_classes(self) -> Dict[str, str]:
         classes = {}
-        
+
+        # Shared col-{n} classes for the grid's default column count;
+        # breakpoints only emit scoped col-{name}-{n} classes when their
+        # column count actually differs, instead of re-stating identical
+        # widths per breakpoint.
+        shared_columns = self.config.grid.columns
+        step = 100.0 / shared_columns
+        for col in range(1, shared_columns + 1):
+            classes[f"col-{col}"] = f"width: {step * col:.2f}%"
+
         for bp in self.config.breakpoints:
+            if bp.columns == shared_columns:
+                continue
+            step = 100.0 / bp.columns
+            name = bp.name
             for col in range(1, bp.columns + 1):
-                class_name = f"col-{bp.name}-{col}"
-                width = self.calculate_column_width(col, bp.name)
-                classes[class_name] = f"width: {width:.2f}%"
-        
+                classes[f"col-{name}-{col}"] = f"width: {step * col:.2f}%"
+
         return classes
     
     def generate_spacing_utilities(self) -> Dict[str, str]:
         """Generate spacing utility classes"""
-        utilities = {}
-        
-        for name, value in self.config.spacing_scale.items():
-            # Margin utilities
-            utilities[f"m-{name}"] = f"margin: {value}px"
-            utilities[f"mt-{name}"] = f"margin-top: {value}px"
-            utilities[f"mr-{name}"] = f"margin-right: {value}px"
-            utilities[f"mb-{name}"] = f"margin-bottom: {value}px"
-            utilities[f"ml-{name}"] = f"margin-left: {value}px"
-            utilities[f"mx-{name}"] = f"margin-left: {value}px; margin-right: {value}px"
-            utilities[f"my-{name}"] = f"margin-top: {value}px; margin-bottom: {value}px"
-            
-            # Padding utilities
-            utilities[f"p-{name}"] = f"padding: {value}px"
-            utilities[f"pt-{name}"] = f"padding-top: {value}px"
-            utilities[f"pr-{name}"] = f"padding-right: {value}px"
-            utilities[f"pb-{name}"] = f"padding-bottom: {value}px"
-            utilities[f"pl-{name}"] = f"padding-left: {value}px"
-            utilities[f"px-{name}"] = f"padding-left: {value}px; padding-right: {value}px"
-            utilities[f"py-{name}"] = f"padding-top: {value}px; padding-bottom: {value}px"
-            
-            # Gap utilities (for flex/grid)
-            utilities[f"gap-{name}"] = f"gap: {value}px"
-        
-        return utilities
+        return self._cached('spacing', self._build_spacing_utilities)
+
+    def _build_spacing_utilities(self) -> Dict[str, str]:
+        return {
+            f"{prefix}-{name}": template.format(v=value)
+            for name, value in self.config.spacing_scale.items()
+            for prefix, template in _SPACING_TEMPLATES
+        }
     
     def generate_z_index_utilities(self) -> Dict[str, str]:
         """Generate z-index utility classes"""
+        return self._cached('z_index', self._build_z_index_utilities)
+
+    def _build_z_index_utilities(self) -> Dict[str, str]:
         utilities = {}
         
         for name, value in self.config.z_index_scale.items():
@@ -209,7 +268,17 @@ class LayoutManager:
     
     def export_layout_tokens(self, output_path: Path) -> None:
         """Export layout tokens as JSON for use in stylesheets"""
-        tokens = {
+        tokens = self._cached('tokens', self._build_layout_tokens)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(tokens, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(tokens, f, indent=2)
+
+    def _build_layout_tokens(self) -> Dict:
+        return {
             'breakpoints': {
                 bp.name: {
                     'minWidth': f"{bp.min_width}px",
@@ -232,14 +301,17 @@ class LayoutManager:
             },
             'zIndex': self.config.z_index_scale
         }
-        
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(tokens, f, indent=2)
     
     def generate_responsive_template(self, project_root: Path) -> None:
         """Generate a responsive layout template file"""
-        template = '''Start Program
+        template_path = project_root / "ui" / "layouts" / "responsive_template.poh"
+        template_path.parent.mkdir(parents=True, exist_ok=True)
+        template_path.write_bytes(_RESPONSIVE_TEMPLATE_BYTES)
+
+
+# Scaffolding file contents, built once at import time instead of on
+# every generate/bootstrap call
+_RESPONSIVE_TEMPLATE = '''Start Program
 
 # Responsive Layout Template
 # Demonstrates responsive design with breakpoints and grid system
@@ -308,33 +380,8 @@ Write "  • lg: 24px  • xl: 32px  • xxl: 48px"
 
 End Program
 '''
-        
-        template_path = project_root / "ui" / "layouts" / "responsive_template.poh"
-        template_path.parent.mkdir(parents=True, exist_ok=True)
-        template_path.write_text(template, encoding='utf-8')
 
-
-def bootstrap_layout_system(project_root: Path) -> Dict[str, any]:
-    """Bootstrap layout system in a project"""
-    layout_dir = project_root / "ui" / "layouts"
-    layout_dir.mkdir(parents=True, exist_ok=True)
-    
-    manager = LayoutManager()
-    
-    # Save layout configuration
-    config_path = layout_dir / "layout_config.json"
-    manager.save_config(config_path)
-    
-    # Export layout tokens
-    tokens_path = layout_dir / "layout_tokens.json"
-    manager.export_layout_tokens(tokens_path)
-    
-    # Generate responsive template
-    manager.generate_responsive_template(project_root)
-    
-    # Create README
-    readme_path = layout_dir / "README.md"
-    readme_content = '''# Layout System
+_LAYOUT_README = '''# Layout System
 
 ## Overview
 This directory contains the responsive layout system configuration and utilities.
@@ -368,7 +415,32 @@ This directory contains the responsive layout system configuration and utilities
 Use layout tokens in your stylesheets and reference grid classes
 in your PohLang UI components for responsive layouts.
 '''
-    readme_path.write_text(readme_content, encoding='utf-8')
+# UTF-8 encoded once so the writers can use write_bytes directly
+_RESPONSIVE_TEMPLATE_BYTES = _RESPONSIVE_TEMPLATE.encode('utf-8')
+_LAYOUT_README_BYTES = _LAYOUT_README.encode('utf-8')
+
+
+def bootstrap_layout_system(project_root: Path) -> Dict[str, any]:
+    """Bootstrap layout system in a project"""
+    layout_dir = project_root / "ui" / "layouts"
+    layout_dir.mkdir(parents=True, exist_ok=True)
+    
+    manager = LayoutManager()
+    
+    # Save layout configuration
+    config_path = layout_dir / "layout_config.json"
+    manager.save_config(config_path)
+    
+    # Export layout tokens
+    tokens_path = layout_dir / "layout_tokens.json"
+    manager.export_layout_tokens(tokens_path)
+    
+    # Generate responsive template
+    manager.generate_responsive_template(project_root)
+    
+    # Create README
+    readme_path = layout_dir / "README.md"
+    readme_path.write_bytes(_LAYOUT_README_BYTES)
     
     return {
         'layout_dir': str(layout_dir),
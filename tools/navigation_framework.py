@@ -4,11 +4,18 @@ Provides routing and navigation system with stack, tab, drawer, and modal naviga
 Includes deep linking, navigation guards, and history management.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from pathlib import Path
 from enum import Enum
 import json
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class NavigationType(Enum):
@@ -19,7 +26,7 @@ class NavigationType(Enum):
     MODAL = "modal"
 
 
-@dataclass
+@dataclass(slots=True)
 class Route:
     """Represents a navigation route"""
     path: str
@@ -31,7 +38,7 @@ class Route:
     guards: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class NavigationStack:
     """Stack navigation history"""
     routes: List[Route] = field(default_factory=list)
@@ -39,10 +46,11 @@ class NavigationStack:
     
     def push(self, route: Route) -> None:
         """Push new route onto stack"""
-        # Clear forward history if navigating from middle of stack
+        # Clear forward history if navigating from middle of stack;
+        # del truncates in place without copying the list
         if self.current_index < len(self.routes) - 1:
-            self.routes = self.routes[:self.current_index + 1]
-        
+            del self.routes[self.current_index + 1:]
+
         self.routes.append(route)
         self.current_index = len(self.routes) - 1
     
@@ -64,17 +72,19 @@ class NavigationStack:
     
     def go_back(self) -> Optional[Route]:
         """Navigate backward in history"""
-        if self.can_go_back():
-            self.current_index -= 1
-            return self.routes[self.current_index]
-        return None
-    
+        index = self.current_index - 1
+        if index < 0:
+            return None
+        self.current_index = index
+        return self.routes[index]
+
     def go_forward(self) -> Optional[Route]:
         """Navigate forward in history"""
-        if self.can_go_forward():
-            self.current_index += 1
-            return self.routes[self.current_index]
-        return None
+        index = self.current_index + 1
+        if index >= len(self.routes):
+            return None
+        self.current_index = index
+        return self.routes[index]
     
     def current_route(self) -> Optional[Route]:
         """Get current route"""
@@ -123,27 +133,63 @@ class NavigationRouter:
         self.current_stack = 'main'
         self.guards: Dict[str, NavigationGuard] = {}
         self.listeners: List[Callable[[Route, Route], None]] = []
-    
+        # Precompiled matchers for ':param' routes; literal paths stay in
+        # the O(1) routes dict
+        self._patterns: List[Tuple[re.Pattern, Route]] = []
+        # Guard names resolved to instances per route path, so navigate()
+        # never has to look guards up by name
+        self._route_guards: Dict[str, List[NavigationGuard]] = {}
+
     def register_route(self, route: Route) -> None:
         """Register a route"""
         self.routes[route.path] = route
-    
+        self._route_guards[route.path] = [
+            self.guards[name] for name in route.guards if name in self.guards
+        ]
+        if ':' in route.path:
+            self._patterns = [(p, r) for p, r in self._patterns if r.path != route.path]
+            pattern = re.compile('^' + re.sub(r':(\w+)', r'(?P<\1>[^/]+)', route.path) + '$')
+            self._patterns.append((pattern, route))
+
     def register_routes(self, routes: List[Route]) -> None:
         """Register multiple routes"""
         for route in routes:
             self.register_route(route)
-    
+
     def register_guard(self, guard: NavigationGuard) -> None:
         """Register a navigation guard"""
         self.guards[guard.name] = guard
+        # Re-resolve routes that were registered before this guard existed
+        for route in self.routes.values():
+            if guard.name in route.guards:
+                self._route_guards[route.path] = [
+                    self.guards[name] for name in route.guards if name in self.guards
+                ]
     
     def add_listener(self, listener: Callable[[Route, Route], None]) -> None:
         """Add navigation listener"""
         self.listeners.append(listener)
     
     def get_route(self, path: str) -> Optional[Route]:
-        """Get route by path"""
-        return self.routes.get(path)
+        """Get route by path, resolving ':param' patterns"""
+        route = self.routes.get(path)
+        if route is not None:
+            return route
+
+        for pattern, candidate in self._patterns:
+            match = pattern.match(path)
+            if match:
+                return Route(
+                    path=candidate.path,
+                    name=candidate.name,
+                    component=candidate.component,
+                    title=candidate.title,
+                    params={**candidate.params, **match.groupdict()},
+                    meta=candidate.meta,
+                    guards=candidate.guards
+                )
+
+        return None
     
     def navigate(self, path: str, params: Optional[Dict[str, Any]] = None) -> bool:
         """Navigate to a route"""
@@ -154,70 +200,67 @@ class NavigationRouter:
         
         # Apply params
         if params:
-            route = Route(
-                path=route.path,
-                name=route.name,
-                component=route.component,
-                title=route.title,
-                params={**route.params, **params},
-                meta=route.meta,
-                guards=route.guards
-            )
+            route = replace(route, params={**route.params, **params})
         
         # Get current route
         stack = self.stacks[self.current_stack]
         current = stack.current_route()
         
-        # Check guards
-        for guard_name in route.guards:
-            guard = self.guards.get(guard_name)
-            if guard and not guard.can_navigate(current, route):
-                print(f"Navigation blocked by guard: {guard_name}")
-                return False
-        
-        # Execute guard callbacks
-        for guard_name in route.guards:
-            guard = self.guards.get(guard_name)
-            if guard:
+        # Check all guards before firing any callbacks; guards are ordered
+        # cheapest-first, so a failure exits before heavier checks run.
+        # get_route only returns registered paths, so the key always exists.
+        resolved_guards = self._route_guards[route.path]
+        if resolved_guards:
+            for guard in resolved_guards:
+                if not guard.can_navigate(current, route):
+                    print(f"Navigation blocked by guard: {guard.name}")
+                    return False
+            for guard in resolved_guards:
                 guard.on_navigation(current, route)
         
         # Push to stack
         stack.push(route)
-        
-        # Notify listeners
-        for listener in self.listeners:
+
+        self._emit(current, route)
+
+        return True
+
+    def _emit(self, from_route: Optional[Route], to_route: Route) -> None:
+        """Notify listeners of a navigation, with fast paths for 0/1 listeners"""
+        listeners = self.listeners
+        if not listeners:
+            return
+        if len(listeners) == 1:
             try:
-                listener(current, route)
+                listeners[0](from_route, to_route)
             except Exception as e:
                 print(f"Navigation listener error: {e}")
-        
-        return True
-    
+            return
+        for listener in listeners:
+            try:
+                listener(from_route, to_route)
+            except Exception as e:
+                print(f"Navigation listener error: {e}")
+
     def go_back(self) -> bool:
         """Navigate back in history"""
         stack = self.stacks[self.current_stack]
+        # Capture the route we are leaving before the index moves; after
+        # go_back() the stack's current route *is* the destination.
+        current = stack.current_route()
         previous = stack.go_back()
         if previous:
-            # Notify listeners
-            for listener in self.listeners:
-                try:
-                    listener(stack.current_route(), previous)
-                except Exception:
-                    pass
+            self._emit(current, previous)
             return True
         return False
-    
+
     def go_forward(self) -> bool:
         """Navigate forward in history"""
         stack = self.stacks[self.current_stack]
+        current = stack.current_route()
         next_route = stack.go_forward()
         if next_route:
-            # Notify listeners
-            for listener in self.listeners:
-                try:
-                    listener(stack.current_route(), next_route)
-                except Exception:
-                    pass
+            self._emit(current, next_route)
             return True
         return False
     
@@ -246,37 +289,16 @@ class NavigationRouter:
         }
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2)
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2)
 
 
-def bootstrap_navigation_system(project_root: Path) -> Dict[str, any]:
-    """Bootstrap navigation system in a project"""
-    nav_dir = project_root / "ui" / "navigation"
-    nav_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create sample routes
-    sample_routes = [
-        Route(path="/", name="home", component="HomePage", title="Home"),
-        Route(path="/products", name="products", component="ProductsPage", title="Products"),
-        Route(path="/product/:id", name="product_detail", component="ProductDetailPage", title="Product Details"),
-        Route(path="/cart", name="cart", component="CartPage", title="Shopping Cart"),
-        Route(path="/checkout", name="checkout", component="CheckoutPage", title="Checkout", guards=["auth"]),
-        Route(path="/profile", name="profile", component="ProfilePage", title="My Profile", 
-              meta={"requiresAuth": True}, guards=["auth"]),
-    ]
-    
-    # Create router and register routes
-    router = NavigationRouter()
-    router.register_routes(sample_routes)
-    
-    # Export config
-    config_path = nav_dir / "routes.json"
-    router.export_config(config_path)
-    
-    # Create navigation template
-    template_path = nav_dir / "navigation_example.poh"
-    template_content = '''Start Program
+# Scaffolding file contents, built once at import time instead of on
+# every bootstrap call
+_NAV_TEMPLATE = '''Start Program
 
 # Navigation Example
 # Demonstrates navigation patterns and routing
@@ -352,11 +374,8 @@ Write "  ✓ Navigation allowed"
 
 End Program
 '''
-    template_path.write_text(template_content, encoding='utf-8')
-    
-    # Create README
-    readme_path = nav_dir / "README.md"
-    readme_content = '''# Navigation System
+
+_NAV_README = '''# Navigation System
 
 ## Overview
 This directory contains the navigation and routing configuration.
@@ -413,7 +432,42 @@ Define routes in `routes.json` and use navigation methods:
 - `goForward()` - Navigate forward
 - `currentRoute()` - Get current route
 '''
-    readme_path.write_text(readme_content, encoding='utf-8')
+# UTF-8 encoded once so the writers can use write_bytes directly
+_NAV_TEMPLATE_BYTES = _NAV_TEMPLATE.encode('utf-8')
+_NAV_README_BYTES = _NAV_README.encode('utf-8')
+
+
+def bootstrap_navigation_system(project_root: Path) -> Dict[str, any]:
+    """Bootstrap navigation system in a project"""
+    nav_dir = project_root / "ui" / "navigation"
+    nav_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Create sample routes
+    sample_routes = [
+        Route(path="/", name="home", component="HomePage", title="Home"),
+        Route(path="/products", name="products", component="ProductsPage", title="Products"),
+        Route(path="/product/:id", name="product_detail", component="ProductDetailPage", title="Product Details"),
+        Route(path="/cart", name="cart", component="CartPage", title="Shopping Cart"),
+        Route(path="/checkout", name="checkout", component="CheckoutPage", title="Checkout", guards=["auth"]),
+        Route(path="/profile", name="profile", component="ProfilePage", title="My Profile", 
+              meta={"requiresAuth": True}, guards=["auth"]),
+    ]
+    
+    # Create router and register routes
+    router = NavigationRouter()
+    router.register_routes(sample_routes)
+    
+    # Export config
+    config_path = nav_dir / "routes.json"
+    router.export_config(config_path)
+    
+    # Create navigation template
+    template_path = nav_dir / "navigation_example.poh"
+    template_path.write_bytes(_NAV_TEMPLATE_BYTES)
+    
+    # Create README
+    readme_path = nav_dir / "README.md"
+    readme_path.write_bytes(_NAV_README_BYTES)
     
     return {
         'nav_dir': str(nav_dir),
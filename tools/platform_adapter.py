@@ -7,15 +7,21 @@ Version: 1.0.0
 """
 
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from typing import Dict, List, Optional, Any, Callable
 from enum import Enum
 import platform
 import json
 from pathlib import Path
+from types import MappingProxyType
 
 
-class Platform(Enum):
-    """Supported platforms"""
+class Platform(str, Enum):
+    """Supported platforms.
+
+    str-mixed so dict dispatch and equality use the interned value's
+    C-level hash/compare instead of Enum's Python-level ones.
+    """
     IOS = "ios"
     ANDROID = "android"
     WINDOWS = "windows"
@@ -24,7 +30,7 @@ class Platform(Enum):
     WEB = "web"
 
 
-class NavigationStyle(Enum):
+class NavigationStyle(str, Enum):
     """Platform-specific navigation styles"""
     IOS_NAVIGATION = "ios_navigation"
     ANDROID_NAVIGATION = "android_navigation"
@@ -36,54 +42,54 @@ class PlatformConvention:
     """Platform UI conventions and patterns"""
     
     # Button positions
-    BUTTON_POSITIONS = {
+    BUTTON_POSITIONS = MappingProxyType({
         Platform.IOS: "right",          # Action buttons on right
         Platform.ANDROID: "right",      # FAB and actions on right
         Platform.WINDOWS: "right",      # OK/Apply on right
         Platform.MACOS: "right",        # Primary action on right
         Platform.WEB: "right"           # Submit on right
-    }
+    })
     
     # Confirmation button order
-    CONFIRMATION_ORDER = {
+    CONFIRMATION_ORDER = MappingProxyType({
         Platform.IOS: ["Cancel", "Confirm"],
         Platform.ANDROID: ["Cancel", "Confirm"],
         Platform.WINDOWS: ["Confirm", "Cancel"],
         Platform.MACOS: ["Cancel", "Confirm"],
         Platform.WEB: ["Cancel", "Confirm"]
-    }
+    })
     
     # Navigation patterns
-    NAVIGATION_PATTERNS = {
+    NAVIGATION_PATTERNS = MappingProxyType({
         Platform.IOS: "hierarchical",       # Back button + title
         Platform.ANDROID: "drawer",         # Hamburger menu
         Platform.WINDOWS: "ribbon",         # Ribbon or menu bar
         Platform.MACOS: "sidebar",          # Sidebar navigation
         Platform.WEB: "header"              # Top navigation bar
-    }
+    })
     
     # System fonts
-    SYSTEM_FONTS = {
+    SYSTEM_FONTS = MappingProxyType({
         Platform.IOS: "-apple-system, BlinkMacSystemFont, 'SF Pro'",
         Platform.ANDROID: "Roboto, 'Noto Sans'",
         Platform.WINDOWS: "'Segoe UI', Tahoma, sans-serif",
         Platform.MACOS: "-apple-system, BlinkMacSystemFont, 'SF Pro'",
         Platform.LINUX: "Ubuntu, 'Liberation Sans', sans-serif",
         Platform.WEB: "system-ui, -apple-system, sans-serif"
-    }
+    })
     
     # Default spacing units
-    SPACING_UNITS = {
+    SPACING_UNITS = MappingProxyType({
         Platform.IOS: 8,
         Platform.ANDROID: 8,
         Platform.WINDOWS: 4,
         Platform.MACOS: 8,
         Platform.LINUX: 4,
         Platform.WEB: 8
-    }
+    })
     
     # Animation durations (ms)
-    ANIMATION_DURATIONS = {
+    ANIMATION_DURATIONS = MappingProxyType({
         Platform.IOS: {
             "quick": 200,
             "normal": 300,
@@ -109,12 +115,16 @@ class PlatformConvention:
             "normal": 300,
             "slow": 500
         }
-    }
+    })
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlatformTheme:
-    """Platform-specific theme configuration"""
+    """Platform-specific theme configuration.
+
+    Immutable; customize via dataclasses.replace. Hashable (with the hash
+    precomputed once) so themes can key memoized adapt helpers directly.
+    """
     platform: Platform
     primary_color: str
     accent_color: str
@@ -125,10 +135,31 @@ class PlatformTheme:
     shadow: str
     border_radius: str
     font_family: str
-    
+    _hash: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_hash', hash((
+            self.platform, self.primary_color, self.accent_color,
+            self.background_color, self.surface_color, self.text_color,
+            self.border_color, self.shadow, self.border_radius,
+            self.font_family
+        )))
+
+    def __hash__(self):
+        return self._hash
+
     @classmethod
     def get_default(cls, platform: Platform) -> 'PlatformTheme':
-        """Get default theme for platform"""
+        """Get the default theme for platform.
+
+        Returns a shared singleton; treat it as read-only and build a new
+        PlatformTheme for customizations.
+        """
+        return _DEFAULT_THEMES[platform]
+
+    @classmethod
+    def _build_default(cls, platform: Platform) -> 'PlatformTheme':
+        """Construct the default theme for platform"""
         if platform == Platform.IOS:
             return cls(
                 platform=platform,
@@ -196,26 +227,52 @@ class PlatformTheme:
             )
 
 
-@dataclass
+# Default theme singletons, built once at import; get_default hands these
+# out instead of constructing a fresh PlatformTheme per adapter
+_DEFAULT_THEMES: Dict[Platform, PlatformTheme] = {
+    p: PlatformTheme._build_default(p) for p in Platform
+}
+
+
+@dataclass(slots=True, frozen=True)
 class HapticFeedback:
     """Haptic feedback configuration"""
     type: str  # 'impact', 'notification', 'selection'
     intensity: str = 'medium'  # 'light', 'medium', 'heavy'
-    
+
     @staticmethod
     def impact(intensity: str = 'medium') -> 'HapticFeedback':
         """Impact haptic (collision, tap)"""
-        return HapticFeedback('impact', intensity)
-    
+        return _HAPTIC_IMPACTS.get(intensity) or HapticFeedback('impact', intensity)
+
     @staticmethod
     def notification(type: str = 'success') -> 'HapticFeedback':
         """Notification haptic (success, warning, error)"""
-        return HapticFeedback('notification', type)
-    
+        return HAPTIC_NOTIFY.get(type) or HapticFeedback('notification', type)
+
     @staticmethod
     def selection() -> 'HapticFeedback':
         """Selection haptic (picker, wheel)"""
-        return HapticFeedback('selection')
+        return HAPTIC_SELECTION
+
+
+# Pre-built haptic singletons (HapticFeedback is frozen, so sharing is
+# safe); the factories and per-tap wrappers hand these out instead of
+# allocating per call
+HAPTIC_IMPACT_LIGHT = HapticFeedback('impact', 'light')
+HAPTIC_IMPACT_MEDIUM = HapticFeedback('impact', 'medium')
+HAPTIC_IMPACT_HEAVY = HapticFeedback('impact', 'heavy')
+HAPTIC_SELECTION = HapticFeedback('selection')
+HAPTIC_NOTIFY = MappingProxyType({
+    'success': HapticFeedback('notification', 'success'),
+    'warning': HapticFeedback('notification', 'warning'),
+    'error': HapticFeedback('notification', 'error'),
+})
+_HAPTIC_IMPACTS = MappingProxyType({
+    'light': HAPTIC_IMPACT_LIGHT,
+    'medium': HAPTIC_IMPACT_MEDIUM,
+    'heavy': HAPTIC_IMPACT_HEAVY,
+})
 
 
 @dataclass
@@ -245,249 +302,343 @@ class GestureConfig:
             )
 
 
+@lru_cache(maxsize=256)
+def _button_style_cached(platform: Platform, style: str,
+                         theme: PlatformTheme) -> Dict:
+    """Build a platform button config (minus label) for a theme.
+
+    Memoized with the immutable theme itself as part of the key, so
+    repeated renders with the same (platform, style, theme) pay a single
+    cache probe; callers must merge-copy, never mutate.
+    """
+    base = {
+        'label': '',
+        'font_family': theme.font_family
+    }
+
+    if platform == Platform.IOS:
+        return {
+            **base,
+            'background': 'transparent' if style == 'secondary' else theme.primary_color,
+            'text_color': theme.primary_color if style == 'secondary' else '#FFFFFF',
+            'border_radius': '10px',
+            'padding': '12px 24px',
+            'font_weight': '600',
+            'border': 'none'
+        }
+    elif platform == Platform.ANDROID:
+        return {
+            **base,
+            'background': theme.primary_color if style == 'primary' else 'transparent',
+            'text_color': '#FFFFFF' if style == 'primary' else theme.primary_color,
+            'border_radius': '4px',
+            'padding': '10px 24px',
+            'font_weight': '500',
+            'elevation': '2' if style == 'primary' else '0',
+            'text_transform': 'uppercase'
+        }
+    elif platform == Platform.WINDOWS:
+        return {
+            **base,
+            'background': theme.primary_color if style == 'primary' else theme.surface_color,
+            'text_color': '#FFFFFF' if style == 'primary' else theme.text_color,
+            'border_radius': '2px',
+            'padding': '8px 16px',
+            'font_weight': '400',
+            'border': f'1px solid {theme.border_color}'
+        }
+    else:  # macOS/Web
+        return {
+            **base,
+            'background': theme.primary_color if style == 'primary' else 'transparent',
+            'text_color': '#FFFFFF' if style == 'primary' else theme.primary_color,
+            'border_radius': '8px',
+            'padding': '10px 20px',
+            'font_weight': '500',
+            'border': f'1px solid {theme.primary_color if style == "secondary" else "transparent"}'
+        }
+
+
+def _build_button_style(platform: Platform, style: str, theme: PlatformTheme,
+                        label: str) -> Dict:
+    """Build a platform button config for an arbitrary theme"""
+    template = _button_style_cached(platform, style, theme)
+    return {**template, 'label': label}
+
+
+def _build_dialog_template(platform: Platform) -> Dict:
+    """Build the static part of a platform dialog config"""
+    placeholders = {'title': '', 'message': '', 'actions': []}
+    if platform == Platform.IOS:
+        return {'type': 'alert', **placeholders,
+                'blur_background': True, 'border_radius': '14px'}
+    elif platform == Platform.ANDROID:
+        return {'type': 'dialog', **placeholders,
+                'elevation': 24, 'border_radius': '4px'}
+    elif platform == Platform.WINDOWS:
+        return {'type': 'message_box', **placeholders,
+                'icon': 'info', 'border_radius': '0px'}
+    else:  # macOS/Web
+        return {'type': 'modal', **placeholders, 'border_radius': '12px'}
+
+
+def _build_nav_template(platform: Platform) -> Dict:
+    """Build the static part of a platform navigation bar config"""
+    if platform == Platform.IOS:
+        return {
+            'type': 'navigation_bar',
+            'title': '',
+            'title_position': 'center',
+            'has_back_button': False,
+            'back_button_style': 'chevron_with_label',
+            'blur_effect': True,
+            'height': '44px'
+        }
+    elif platform == Platform.ANDROID:
+        return {
+            'type': 'app_bar',
+            'title': '',
+            'title_position': 'left',
+            'has_back_button': False,
+            'back_button_style': 'arrow',
+            'elevation': 4,
+            'height': '56px'
+        }
+    elif platform == Platform.WINDOWS:
+        return {
+            'type': 'title_bar',
+            'title': '',
+            'title_position': 'left',
+            'has_back_button': False,
+            'back_button_style': 'arrow',
+            'height': '32px'
+        }
+    else:  # macOS/Web
+        return {
+            'type': 'header',
+            'title': '',
+            'title_position': 'center',
+            'has_back_button': False,
+            'back_button_style': 'chevron',
+            'height': '52px'
+        }
+
+
+def _build_list_item_template(platform: Platform) -> Dict:
+    """Build the static part of a platform list item config"""
+    base = {
+        'title': '',
+        'subtitle': None,
+        'icon': None,
+        'has_disclosure': False,
+        'font_family': PlatformConvention.SYSTEM_FONTS[platform]
+    }
+    if platform == Platform.IOS:
+        return {
+            **base,
+            'padding': '12px 16px',
+            'separator_style': 'inset',
+            'disclosure_icon': 'chevron_right',
+            'icon_size': '29px'
+        }
+    elif platform == Platform.ANDROID:
+        return {
+            **base,
+            'padding': '16px',
+            'separator_style': 'full',
+            'disclosure_icon': 'chevron_right',
+            'icon_size': '24px',
+            'ripple_effect': True
+        }
+    elif platform == Platform.WINDOWS:
+        return {
+            **base,
+            'padding': '8px 12px',
+            'separator_style': 'full',
+            'disclosure_icon': 'chevron_right',
+            'icon_size': '16px'
+        }
+    else:  # macOS/Web
+        return {
+            **base,
+            'padding': '12px 16px',
+            'separator_style': 'full',
+            'disclosure_icon': 'chevron_right',
+            'icon_size': '20px'
+        }
+
+
+# Per-platform component templates, built once at import time. The adapt
+# methods overwrite the dynamic keys on a shallow merge, which keeps the
+# key order of the old per-call dict literals.
+_BUTTON_STYLES: Dict = {
+    (p, style): _build_button_style(p, style, PlatformTheme.get_default(p), '')
+    for p in Platform for style in ('primary', 'secondary')
+}
+_DIALOG_TEMPLATES: Dict = {p: _build_dialog_template(p) for p in Platform}
+_NAV_TEMPLATES: Dict = {p: _build_nav_template(p) for p in Platform}
+_LIST_ITEM_TEMPLATES: Dict = {p: _build_list_item_template(p) for p in Platform}
+_LIST_ITEM_DEFAULTS = {'title': '', 'subtitle': None, 'icon': None, 'has_disclosure': False}
+
+# Pre-serialized button configs with a label placeholder, for consumers
+# that only need the JSON form
+_BUTTON_JSON_TEMPLATES: Dict = {
+    key: json.dumps({**style, 'label': '__LABEL__'})
+    for key, style in _BUTTON_STYLES.items()
+}
+
+
+_FEATURE_PLATFORMS = {
+    'haptics': (Platform.IOS, Platform.ANDROID),
+    'blur_effects': (Platform.IOS, Platform.MACOS, Platform.WEB),
+    'elevation_shadows': (Platform.ANDROID, Platform.WEB),
+    'system_gestures': (Platform.IOS, Platform.ANDROID),
+    'dark_mode': (Platform.IOS, Platform.ANDROID, Platform.MACOS, Platform.WINDOWS, Platform.WEB),
+    'notifications': (Platform.IOS, Platform.ANDROID, Platform.WINDOWS, Platform.MACOS, Platform.WEB),
+    'file_picker': (Platform.WINDOWS, Platform.MACOS, Platform.LINUX, Platform.WEB)
+}
+
+# Inverted at import so supports_feature is a single set membership test
+_PLATFORM_FEATURES: Dict[Platform, frozenset] = {
+    p: frozenset(
+        feature for feature, platforms in _FEATURE_PLATFORMS.items() if p in platforms
+    )
+    for p in Platform
+}
+
+
+@cache
+def _detected_platform() -> Platform:
+    """Auto-detect the current platform; the host never changes, so the
+    result is cached for every adapter constructed in this process"""
+    system = platform.system().lower()
+
+    if system == 'darwin':
+        # Check if iOS (in production, would check device)
+        return Platform.MACOS
+    elif system == 'windows':
+        return Platform.WINDOWS
+    elif system == 'linux':
+        # Check if Android (in production, would check device)
+        return Platform.LINUX
+    else:
+        return Platform.WEB
+
+
 class PlatformAdapter:
     """Adapts UI components to platform-specific conventions"""
-    
+
     def __init__(self, platform: Optional[Platform] = None):
-        self.platform = platform or self._detect_platform()
+        self.platform = platform or _detected_platform()
         self.theme = PlatformTheme.get_default(self.platform)
+        # adapt_button can use the precomputed templates as long as the
+        # theme has not been swapped for a custom one
+        self._default_theme = self.theme
         self.gesture_config = GestureConfig.get_default(self.platform)
         self.haptics_enabled = self.platform in [Platform.IOS, Platform.ANDROID]
-    
-    def _detect_platform(self) -> Platform:
-        """Auto-detect current platform"""
-        system = platform.system().lower()
-        
-        if system == 'darwin':
-            # Check if iOS (in production, would check device)
-            return Platform.MACOS
-        elif system == 'windows':
-            return Platform.WINDOWS
-        elif system == 'linux':
-            # Check if Android (in production, would check device)
-            return Platform.LINUX
-        else:
-            return Platform.WEB
+        # Bind the per-platform duration table once so the hot path is a
+        # single dict.get (may be None for platforms without an entry)
+        self._anim_durations = PlatformConvention.ANIMATION_DURATIONS.get(self.platform)
+        self._anim_normal = self._anim_durations['normal'] if self._anim_durations else None
+        # Remaining per-platform convention values, bound once so the
+        # getters are plain attribute reads
+        self._system_font = PlatformConvention.SYSTEM_FONTS[self.platform]
+        self._spacing_unit = PlatformConvention.SPACING_UNITS[self.platform]
+        # Native haptic hook; trigger_haptic is a no-op until one is set
+        self._haptic_callback: Optional[Callable[[HapticFeedback], None]] = None
     
     def adapt_button(self, label: str, style: str = 'primary') -> Dict:
         """Adapt button to platform conventions"""
-        base = {
-            'label': label,
-            'font_family': self.theme.font_family
-        }
-        
-        if self.platform == Platform.IOS:
-            return {
-                **base,
-                'background': 'transparent' if style == 'secondary' else self.theme.primary_color,
-                'text_color': self.theme.primary_color if style == 'secondary' else '#FFFFFF',
-                'border_radius': '10px',
-                'padding': '12px 24px',
-                'font_weight': '600',
-                'border': 'none'
-            }
-        elif self.platform == Platform.ANDROID:
-            return {
-                **base,
-                'background': self.theme.primary_color if style == 'primary' else 'transparent',
-                'text_color': '#FFFFFF' if style == 'primary' else self.theme.primary_color,
-                'border_radius': '4px',
-                'padding': '10px 24px',
-                'font_weight': '500',
-                'elevation': '2' if style == 'primary' else '0',
-                'text_transform': 'uppercase'
-            }
-        elif self.platform == Platform.WINDOWS:
-            return {
-                **base,
-                'background': self.theme.primary_color if style == 'primary' else self.theme.surface_color,
-                'text_color': '#FFFFFF' if style == 'primary' else self.theme.text_color,
-                'border_radius': '2px',
-                'padding': '8px 16px',
-                'font_weight': '400',
-                'border': f'1px solid {self.theme.border_color}'
-            }
-        else:  # macOS/Web
-            return {
-                **base,
-                'background': self.theme.primary_color if style == 'primary' else 'transparent',
-                'text_color': '#FFFFFF' if style == 'primary' else self.theme.primary_color,
-                'border_radius': '8px',
-                'padding': '10px 20px',
-                'font_weight': '500',
-                'border': f'1px solid {self.theme.primary_color if style == "secondary" else "transparent"}'
-            }
+        template = _BUTTON_STYLES.get((self.platform, style))
+        if template is not None and self.theme is self._default_theme:
+            return {**template, 'label': label}
+        # Custom theme or non-standard style: build the config directly
+        return _build_button_style(self.platform, style, self.theme, label)
+
+    def adapt_button_json(self, label: str, style: str = 'primary') -> str:
+        """Serialized adapt_button output, skipping the dict build.
+
+        Substitutes the label into a pre-serialized template; custom
+        themes and non-standard styles fall back to serializing the dict.
+        """
+        template = _BUTTON_JSON_TEMPLATES.get((self.platform, style))
+        if template is not None and self.theme is self._default_theme:
+            return template.replace('"__LABEL__"', json.dumps(label))
+        return json.dumps(self.adapt_button(label, style))
     
     def adapt_dialog(self, title: str, message: str, actions: List[str]) -> Dict:
         """Adapt dialog to platform conventions"""
         button_order = PlatformConvention.CONFIRMATION_ORDER[self.platform]
+
+        # Platform-ordered buttons first, then any remaining actions;
+        # dict.fromkeys dedupes while preserving insertion order
+        action_set = set(actions)
+        ordered_actions = list(dict.fromkeys(
+            [btn for btn in button_order if btn in action_set] + actions
+        ))
         
-        # Reorder actions based on platform
-        ordered_actions = []
-        for btn in button_order:
-            if btn in actions:
-                ordered_actions.append(btn)
-        # Add any remaining actions
-        for action in actions:
-            if action not in ordered_actions:
-                ordered_actions.append(action)
-        
-        if self.platform == Platform.IOS:
-            return {
-                'type': 'action_sheet' if len(actions) > 2 else 'alert',
-                'title': title,
-                'message': message,
-                'actions': ordered_actions,
-                'blur_background': True,
-                'border_radius': '14px'
-            }
-        elif self.platform == Platform.ANDROID:
-            return {
-                'type': 'dialog',
-                'title': title,
-                'message': message,
-                'actions': ordered_actions,
-                'elevation': 24,
-                'border_radius': '4px'
-            }
-        elif self.platform == Platform.WINDOWS:
-            return {
-                'type': 'message_box',
-                'title': title,
-                'message': message,
-                'actions': ordered_actions,
-                'icon': 'info',
-                'border_radius': '0px'
-            }
-        else:  # macOS/Web
-            return {
-                'type': 'modal',
-                'title': title,
-                'message': message,
-                'actions': ordered_actions,
-                'border_radius': '12px'
-            }
+        dialog = {
+            **_DIALOG_TEMPLATES[self.platform],
+            'title': title,
+            'message': message,
+            'actions': ordered_actions
+        }
+        if self.platform == Platform.IOS and len(actions) > 2:
+            dialog['type'] = 'action_sheet'
+        return dialog
     
     def adapt_navigation(self, title: str, has_back: bool = False) -> Dict:
         """Adapt navigation bar to platform"""
-        if self.platform == Platform.IOS:
-            return {
-                'type': 'navigation_bar',
-                'title': title,
-                'title_position': 'center',
-                'has_back_button': has_back,
-                'back_button_style': 'chevron_with_label',
-                'blur_effect': True,
-                'height': '44px'
-            }
-        elif self.platform == Platform.ANDROID:
-            return {
-                'type': 'app_bar',
-                'title': title,
-                'title_position': 'left',
-                'has_back_button': has_back,
-                'back_button_style': 'arrow',
-                'elevation': 4,
-                'height': '56px'
-            }
-        elif self.platform == Platform.WINDOWS:
-            return {
-                'type': 'title_bar',
-                'title': title,
-                'title_position': 'left',
-                'has_back_button': has_back,
-                'back_button_style': 'arrow',
-                'height': '32px'
-            }
-        else:  # macOS/Web
-            return {
-                'type': 'header',
-                'title': title,
-                'title_position': 'center',
-                'has_back_button': has_back,
-                'back_button_style': 'chevron',
-                'height': '52px'
-            }
+        return {
+            **_NAV_TEMPLATES[self.platform],
+            'title': title,
+            'has_back_button': has_back
+        }
     
-    def adapt_list_item(self, title: str, subtitle: Optional[str] = None, 
+    def adapt_list_item(self, title: str, subtitle: Optional[str] = None,
                        icon: Optional[str] = None, has_disclosure: bool = False) -> Dict:
         """Adapt list item to platform"""
-        base = {
+        return {
+            **_LIST_ITEM_TEMPLATES[self.platform],
             'title': title,
             'subtitle': subtitle,
             'icon': icon,
             'has_disclosure': has_disclosure,
             'font_family': self.theme.font_family
         }
-        
-        if self.platform == Platform.IOS:
-            return {
-                **base,
-                'padding': '12px 16px',
-                'separator_style': 'inset',
-                'disclosure_icon': 'chevron_right',
-                'icon_size': '29px'
-            }
-        elif self.platform == Platform.ANDROID:
-            return {
-                **base,
-                'padding': '16px',
-                'separator_style': 'full',
-                'disclosure_icon': 'chevron_right',
-                'icon_size': '24px',
-                'ripple_effect': True
-            }
-        elif self.platform == Platform.WINDOWS:
-            return {
-                **base,
-                'padding': '8px 12px',
-                'separator_style': 'full',
-                'disclosure_icon': 'chevron_right',
-                'icon_size': '16px'
-            }
-        else:  # macOS/Web
-            return {
-                **base,
-                'padding': '12px 16px',
-                'separator_style': 'full',
-                'disclosure_icon': 'chevron_right',
-                'icon_size': '20px'
-            }
     
     def get_animation_duration(self, speed: str = 'normal') -> int:
         """Get platform-appropriate animation duration"""
-        durations = PlatformConvention.ANIMATION_DURATIONS[self.platform]
-        return durations.get(speed, durations['normal'])
-    
+        durations = self._anim_durations
+        if durations is None:
+            # Preserve the KeyError for platforms without a duration table
+            durations = PlatformConvention.ANIMATION_DURATIONS[self.platform]
+        return durations.get(speed, self._anim_normal)
+    
+    def set_haptic_callback(self, callback: Optional[Callable[[HapticFeedback], None]]) -> None:
+        """Register the native haptic hook invoked by trigger_haptic"""
+        self._haptic_callback = callback
+
     def trigger_haptic(self, haptic: HapticFeedback):
-        """Trigger haptic feedback (if supported)"""
+        """Trigger haptic feedback (if supported and a hook is registered)"""
         if not self.haptics_enabled:
             return
-        
-        # In production, would call native haptic API
-        print(f"Haptic: {haptic.type} - {haptic.intensity}")
+
+        callback = self._haptic_callback
+        if callback is not None:
+            callback(haptic)
     
     def get_system_font(self) -> str:
         """Get platform system font"""
-        return PlatformConvention.SYSTEM_FONTS[self.platform]
-    
+        return self._system_font
+
     def get_spacing_unit(self) -> int:
         """Get platform spacing unit"""
-        return PlatformConvention.SPACING_UNITS[self.platform]
+        return self._spacing_unit
     
     def supports_feature(self, feature: str) -> bool:
         """Check if platform supports feature"""
-        features = {
-            'haptics': [Platform.IOS, Platform.ANDROID],
-            'blur_effects': [Platform.IOS, Platform.MACOS, Platform.WEB],
-            'elevation_shadows': [Platform.ANDROID, Platform.WEB],
-            'system_gestures': [Platform.IOS, Platform.ANDROID],
-            'dark_mode': [Platform.IOS, Platform.ANDROID, Platform.MACOS, Platform.WINDOWS, Platform.WEB],
-            'notifications': [Platform.IOS, Platform.ANDROID, Platform.WINDOWS, Platform.MACOS, Platform.WEB],
-            'file_picker': [Platform.WINDOWS, Platform.MACOS, Platform.LINUX, Platform.WEB]
-        }
-        
-        return self.platform in features.get(feature, [])
+        return feature in _PLATFORM_FEATURES[self.platform]
 
 
 class NativeComponentWrapper:
@@ -498,16 +649,18 @@ class NativeComponentWrapper:
     
     def create_button(self, label: str, on_click: Callable, style: str = 'primary') -> Dict:
         """Create platform-adapted button"""
-        button_style = self.adapter.adapt_button(label, style)
-        
+        adapter = self.adapter
+        button_style = adapter.adapt_button(label, style)
+        # Bind the trigger once; the click path then runs on locals only
+        trigger = adapter.trigger_haptic if adapter.haptics_enabled else None
+
         def wrapped_click():
-            # Trigger haptic feedback
-            if self.adapter.haptics_enabled:
-                self.adapter.trigger_haptic(HapticFeedback.impact('light'))
-            
+            if trigger is not None:
+                trigger(HAPTIC_IMPACT_LIGHT)
+
             # Call original handler
             on_click()
-        
+
         return {
             'component': 'button',
             'style': button_style,
@@ -534,22 +687,32 @@ class NativeComponentWrapper:
     
     def create_list(self, items: List[Dict], on_item_click: Callable) -> Dict:
         """Create platform-adapted list"""
-        adapted_items = []
-        
-        for item in items:
-            adapted_item = self.adapter.adapt_list_item(
-                title=item.get('title', ''),
-                subtitle=item.get('subtitle'),
-                icon=item.get('icon'),
-                has_disclosure=item.get('has_disclosure', False)
-            )
-            adapted_items.append(adapted_item)
+        # Resolve the platform template and font once instead of
+        # re-dispatching through adapt_list_item per item; a defaults
+        # merge replaces four dict.get calls per item
+        template = _LIST_ITEM_TEMPLATES[self.adapter.platform]
+        font_family = self.adapter.theme.font_family
+        adapted_items = [
+            {
+                **template,
+                'title': filled['title'],
+                'subtitle': filled['subtitle'],
+                'icon': filled['icon'],
+                'has_disclosure': filled['has_disclosure'],
+                'font_family': font_family
+            }
+            for filled in ({**_LIST_ITEM_DEFAULTS, **item} for item in items)
+        ]
         
+        # Trigger haptic on mobile; resolved once at wrapper creation
+        adapter = self.adapter
+        trigger = adapter.trigger_haptic \
+            if adapter.platform in (Platform.IOS, Platform.ANDROID) else None
+
         def wrapped_click(index: int):
-            # Trigger haptic on mobile
-            if self.adapter.platform in [Platform.IOS, Platform.ANDROID]:
-                self.adapter.trigger_haptic(HapticFeedback.selection())
-            
+            if trigger is not None:
+                trigger(HAPTIC_SELECTION)
+
             on_item_click(index)
         
         return {
@@ -560,12 +723,14 @@ class NativeComponentWrapper:
     
     def create_navigation_bar(self, title: str, on_back: Optional[Callable] = None) -> Dict:
         """Create platform-adapted navigation bar"""
-        nav_config = self.adapter.adapt_navigation(title, has_back=on_back is not None)
-        
+        adapter = self.adapter
+        nav_config = adapter.adapt_navigation(title, has_back=on_back is not None)
+        trigger = adapter.trigger_haptic if adapter.haptics_enabled else None
+
         def wrapped_back():
-            if self.adapter.haptics_enabled:
-                self.adapter.trigger_haptic(HapticFeedback.impact('light'))
-            
+            if trigger is not None:
+                trigger(HAPTIC_IMPACT_LIGHT)
+
             if on_back:
                 on_back()
         
@@ -576,52 +741,139 @@ class NativeComponentWrapper:
         }
 
 
+# Per-platform layout tables; platforms without an entry fall back to the
+# defaults via dict.get. Values are read-only views over shared singletons
+# so the getters return without copying.
+_SAFE_AREA_INSETS = {
+    # iPhone with notch
+    Platform.IOS: MappingProxyType({'top': 47, 'bottom': 34, 'left': 0, 'right': 0}),
+    # Status bar + navigation bar
+    Platform.ANDROID: MappingProxyType({'top': 24, 'bottom': 48, 'left': 0, 'right': 0}),
+}
+_ZERO_INSETS = MappingProxyType({'top': 0, 'bottom': 0, 'left': 0, 'right': 0})
+
+_FORM_LAYOUTS = {
+    Platform.IOS: MappingProxyType({
+        'spacing': 16,
+        'input_height': 44,
+        'label_style': 'above',
+        'group_style': 'grouped'
+    }),
+    Platform.ANDROID: MappingProxyType({
+        'spacing': 16,
+        'input_height': 56,
+        'label_style': 'floating',
+        'group_style': 'outlined'
+    }),
+}
+_DEFAULT_FORM_LAYOUT = MappingProxyType({
+    'spacing': 12,
+    'input_height': 40,
+    'label_style': 'above',
+    'group_style': 'standard'
+})
+
+_LIST_LAYOUTS = {
+    Platform.IOS: MappingProxyType({
+        'item_height': 44,
+        'section_header_height': 28,
+        'separator_inset': 16
+    }),
+    Platform.ANDROID: MappingProxyType({
+        'item_height': 72,
+        'section_header_height': 48,
+        'separator_inset': 0
+    }),
+}
+_DEFAULT_LIST_LAYOUT = MappingProxyType({
+    'item_height': 48,
+    'section_header_height': 32,
+    'separator_inset': 0
+})
+
+_DETAIL_LAYOUTS = {
+    Platform.IOS: MappingProxyType({
+        'header_height': 300,
+        'content_padding': 20,
+        'section_spacing': 32
+    }),
+    Platform.ANDROID: MappingProxyType({
+        'header_height': 256,
+        'content_padding': 16,
+        'section_spacing': 24
+    }),
+}
+_DEFAULT_DETAIL_LAYOUT = MappingProxyType({
+    'header_height': 240,
+    'content_padding': 24,
+    'section_spacing': 32
+})
+
+
 class PlatformLayoutManager:
     """Manages platform-specific layouts"""
-    
+
     def __init__(self, adapter: PlatformAdapter):
         self.adapter = adapter
-    
+        # Insets never change for a given platform; unpack them once so
+        # apply_safe_area skips the table and key lookups entirely
+        self._insets = _SAFE_AREA_INSETS.get(adapter.platform, _ZERO_INSETS)
+        self._inset_top = self._insets['top']
+        self._inset_bottom = self._insets['bottom']
+        self._inset_left = self._insets['left']
+        self._inset_right = self._insets['right']
+
     def get_safe_area_insets(self) -> Dict[str, int]:
-        """Get platform safe area insets"""
-        if self.adapter.platform == Platform.IOS:
-            # iPhone with notch
-            return {
-                'top': 47,
-                'bottom': 34,
-                'left': 0,
-                'right': 0
-            }
-        elif self.adapter.platform == Platform.ANDROID:
-            # Status bar + navigation bar
-            return {
-                'top': 24,
-                'bottom': 48,
-                'left': 0,
-                'right': 0
-            }
-        else:
-            return {
-                'top': 0,
-                'bottom': 0,
-                'left': 0,
-                'right': 0
-            }
-    
+        """Get platform safe area insets (read-only mapping)"""
+        return self._insets
+
     def apply_safe_area(self, layout: Dict) -> Dict:
-        """Apply safe area insets to layout"""
-        insets = self.get_safe_area_insets()
-        
-        layout['padding'] = layout.get('padding', {})
-        layout['padding']['top'] = layout['padding'].get('top', 0) + insets['top']
-        layout['padding']['bottom'] = layout['padding'].get('bottom', 0) + insets['bottom']
-        layout['padding']['left'] = layout['padding'].get('left', 0) + insets['left']
-        layout['padding']['right'] = layout['padding'].get('right', 0) + insets['right']
-        
-        return layout
+        """Return a copy of layout with safe area insets added to its padding.
+
+        The input is left untouched, so shared or read-only layouts (e.g.
+        from get_platform_layout) can be passed in safely.
+        """
+        padding = layout.get('padding') or {}
+        get = padding.get
+        return {
+            **layout,
+            'padding': {
+                **padding,
+                'top': get('top', 0) + self._inset_top,
+                'bottom': get('bottom', 0) + self._inset_bottom,
+                'left': get('left', 0) + self._inset_left,
+                'right': get('right', 0) + self._inset_right,
+            }
+        }
     
+    def apply_safe_area_batch(self, layouts: List[Dict]) -> List[Dict]:
+        """Apply safe area insets to a whole list of layouts.
+
+        Same semantics as apply_safe_area per element, but the insets and
+        lookups are hoisted out of the loop for large UI trees.
+        """
+        top, bottom = self._inset_top, self._inset_bottom
+        left, right = self._inset_left, self._inset_right
+        empty: Dict = {}
+        out = []
+        append = out.append
+        for layout in layouts:
+            padding = layout.get('padding') or empty
+            get = padding.get
+            append({
+                **layout,
+                'padding': {
+                    **padding,
+                    'top': get('top', 0) + top,
+                    'bottom': get('bottom', 0) + bottom,
+                    'left': get('left', 0) + left,
+                    'right': get('right', 0) + right,
+                }
+            })
+        return out
+
     def get_platform_layout(self, layout_type: str) -> Dict:
-        """Get platform-specific layout configuration"""
+        """Get platform-specific layout configuration (read-only mapping)"""
         layouts = {
             'form': self._get_form_layout(),
             'list': self._get_list_layout(),
@@ -633,48 +885,11 @@ class PlatformLayoutManager:
     
     def _get_form_layout(self) -> Dict:
         """Platform-specific form layout"""
-        if self.adapter.platform == Platform.IOS:
-            return {
-                'spacing': 16,
-                'input_height': 44,
-                'label_style': 'above',
-                'group_style': 'grouped'
-            }
-        elif self.adapter.platform == Platform.ANDROID:
-            return {
-                'spacing': 16,
-                'input_height': 56,
-                'label_style': 'floating',
-                'group_style': 'outlined'
-            }
-        else:
-            return {
-                'spacing': 12,
-                'input_height': 40,
-                'label_style': 'above',
-                'group_style': 'standard'
-            }
-    
+        return _FORM_LAYOUTS.get(self.adapter.platform, _DEFAULT_FORM_LAYOUT)
+
     def _get_list_layout(self) -> Dict:
         """Platform-specific list layout"""
-        if self.adapter.platform == Platform.IOS:
-            return {
-                'item_height': 44,
-                'section_header_height': 28,
-                'separator_inset': 16
-            }
-        elif self.adapter.platform == Platform.ANDROID:
-            return {
-                'item_height': 72,
-                'section_header_height': 48,
-                'separator_inset': 0
-            }
-        else:
-            return {
-                'item_height': 48,
-                'section_header_height': 32,
-                'separator_inset': 0
-            }
+        return _LIST_LAYOUTS.get(self.adapter.platform, _DEFAULT_LIST_LAYOUT)
     
     def _get_grid_layout(self) -> Dict:
         """Platform-specific grid layout"""
@@ -688,24 +903,7 @@ class PlatformLayoutManager:
     
     def _get_detail_layout(self) -> Dict:
         """Platform-specific detail view layout"""
-        if self.adapter.platform == Platform.IOS:
-            return {
-                'header_height': 300,
-                'content_padding': 20,
-                'section_spacing': 32
-            }
-        elif self.adapter.platform == Platform.ANDROID:
-            return {
-                'header_height': 256,
-                'content_padding': 16,
-                'section_spacing': 24
-            }
-        else:
-            return {
-                'header_height': 240,
-                'content_padding': 24,
-                'section_spacing': 32
-            }
+        return _DETAIL_LAYOUTS.get(self.adapter.platform, _DEFAULT_DETAIL_LAYOUT)
 
 
 # Export main classes
@@ -715,6 +913,11 @@ __all__ = [
     'NativeComponentWrapper',
     'PlatformLayoutManager',
     'HapticFeedback',
+    'HAPTIC_IMPACT_LIGHT',
+    'HAPTIC_IMPACT_MEDIUM',
+    'HAPTIC_IMPACT_HEAVY',
+    'HAPTIC_SELECTION',
+    'HAPTIC_NOTIFY',
     'GestureConfig',
     'PlatformTheme',
     'PlatformConvention'
@@ -23,13 +23,26 @@ import sys
 import hashlib
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
+import mmap
 import pickle
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Files above this size are mmap'd so the hasher sees one contiguous
+# buffer and the kernel handles prefetching; smaller files are cheaper
+# to read in one shot
+MMAP_THRESHOLD = 64 * 1024
+
 
 class Platform(Enum):
     """Supported platforms"""
@@ -97,52 +110,144 @@ class BuildCache:
     def __init__(self, cache_dir: Path):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.metadata_file = self.cache_dir / "cache_metadata.json"
+        self.metadata_file = self.cache_dir / "cache_metadata.pkl"
+        self.legacy_metadata_file = self.cache_dir / "cache_metadata.json"
         self.metadata = self._load_metadata()
-    
+
     def _load_metadata(self) -> Dict:
         """Load cache metadata"""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
+                with open(self.metadata_file, 'rb') as f:
+                    return pickle.load(f)
+            except:
+                return {}
+        # Migrate metadata written by older versions
+        if self.legacy_metadata_file.exists():
+            try:
+                with open(self.legacy_metadata_file, 'r') as f:
                     return json.load(f)
             except:
                 return {}
         return {}
-    
+
     def _save_metadata(self):
         """Save cache metadata"""
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
+        self.flush()
+
+    def flush(self):
+        """Persist cache metadata to disk in a single atomic write"""
+        tmp_file = self.metadata_file.with_suffix('.pkl.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(self.metadata, f, protocol=5)
+        os.replace(tmp_file, self.metadata_file)
     
     def get_file_hash(self, file_path: Path) -> str:
-        """Calculate file hash"""
-        hasher = hashlib.md5()
+        """Calculate file fingerprint (change detection only, not security)"""
+        hasher = blake3.blake3() if BLAKE3_AVAILABLE else hashlib.md5()
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
+            if file_path.stat().st_size > MMAP_THRESHOLD:
+                with open(file_path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hasher.update(mm)
+            else:
+                # Most source files are small - hash them in one read
+                hasher.update(file_path.read_bytes())
             return hasher.hexdigest()
         except:
             return ""
     
+    @staticmethod
+    def _split_entry(entry) -> Tuple[Optional[Tuple[int, int]], Optional[str]]:
+        """Return ((size, mtime_ns), digest) from a cache entry,
+        tolerating the old digest-only string format"""
+        if isinstance(entry, list) and len(entry) == 3:
+            return (entry[0], entry[1]), entry[2]
+        if isinstance(entry, str):
+            return None, entry
+        return None, None
+
+    def _make_entry(self, file_path: Path) -> List:
+        """Build a [size, mtime_ns, digest] cache entry"""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return [0, 0, ""]
+        return [st.st_size, st.st_mtime_ns, self.get_file_hash(file_path)]
+
     def has_changed(self, file_path: Path, cache_key: str) -> bool:
         """Check if file has changed since last build"""
-        current_hash = self.get_file_hash(file_path)
-        cached_hash = self.metadata.get(cache_key, {}).get(str(file_path))
-        return current_hash != cached_hash
-    
+        entry = self.metadata.get(cache_key, {}).get(str(file_path))
+        stat_info, cached_hash = self._split_entry(entry)
+        try:
+            st = file_path.stat()
+        except OSError:
+            return True
+        if stat_info is not None and (st.st_size, st.st_mtime_ns) == stat_info:
+            return False
+        if cached_hash is None:
+            return True
+        return self.get_file_hash(file_path) != cached_hash
+
     def update_cache(self, file_path: Path, cache_key: str):
         """Update cache entry for file"""
-        current_hash = self.get_file_hash(file_path)
         if cache_key not in self.metadata:
             self.metadata[cache_key] = {}
-        self.metadata[cache_key][str(file_path)] = current_hash
+        self.metadata[cache_key][str(file_path)] = self._make_entry(file_path)
         self._save_metadata()
-    
+
+    def update_cache_batch(self, entries: Dict[str, List], cache_key: str):
+        """Update cache entries in memory without persisting to disk"""
+        if cache_key not in self.metadata:
+            self.metadata[cache_key] = {}
+        self.metadata[cache_key].update(entries)
+
     def get_changed_files(self, file_paths: List[Path], cache_key: str) -> List[Path]:
         """Get list of files that have changed"""
-        return [f for f in file_paths if self.has_changed(f, cache_key)]
+        if len(file_paths) <= 1:
+            return [f for f in file_paths if self.has_changed(f, cache_key)]
+
+        cached = self.metadata.get(cache_key, {})
+        changed = set()
+        candidates = []  # (file, cached digest) pairs that still need hashing
+        for f in file_paths:
+            stat_info, cached_hash = self._split_entry(cached.get(str(f)))
+            try:
+                st = f.stat()
+            except OSError:
+                changed.add(f)
+                continue
+            if stat_info is not None and (st.st_size, st.st_mtime_ns) == stat_info:
+                continue
+            if cached_hash is None:
+                changed.add(f)
+            else:
+                candidates.append((f, cached_hash))
+
+        if candidates:
+            with ThreadPoolExecutor(max_workers=self._hash_workers()) as executor:
+                futures = {
+                    executor.submit(self.get_file_hash, f): (f, cached_hash)
+                    for f, cached_hash in candidates
+                }
+                for future in as_completed(futures):
+                    f, cached_hash = futures[future]
+                    if future.result() != cached_hash:
+                        changed.add(f)
+        return [f for f in file_paths if f in changed]
+
+    def hash_all(self, file_paths: List[Path]) -> Dict[str, List]:
+        """Fingerprint files concurrently, keyed by path string"""
+        with ThreadPoolExecutor(max_workers=self._hash_workers()) as executor:
+            return {
+                str(f): entry
+                for f, entry in zip(file_paths, executor.map(self._make_entry, file_paths))
+            }
+
+    @staticmethod
+    def _hash_workers() -> int:
+        """Worker count for IO-bound hashing"""
+        return min(32, (os.cpu_count() or 4) * 4)
     
     def clear_cache(self, cache_key: Optional[str] = None):
         """Clear cache entries"""
@@ -202,27 +307,52 @@ class DependencyValidator:
         ],
     }
     
+    # Probe results cached per check command so repeated build() calls in
+    # one session don't re-spawn the same --version subprocesses
+    _probe_cache: Dict[Tuple[Platform, str], Tuple[float, bool]] = {}
+    _probe_cache_lock = threading.Lock()
+    PROBE_CACHE_TTL = 300.0  # seconds
+
+    @classmethod
+    def _probe(cls, platform: Platform, dep: DependencyInfo) -> bool:
+        """Run (or recall) a single dependency check command"""
+        key = (platform, dep.check_command)
+        now = time.time()
+        with cls._probe_cache_lock:
+            cached = cls._probe_cache.get(key)
+            if cached and now - cached[0] < cls.PROBE_CACHE_TTL:
+                return cached[1]
+        try:
+            result = subprocess.run(
+                dep.check_command.split(),
+                capture_output=True,
+                timeout=5
+            )
+            installed = result.returncode == 0
+        except:
+            installed = False
+        with cls._probe_cache_lock:
+            cls._probe_cache[key] = (now, installed)
+        return installed
+
     @classmethod
     def check_dependencies(cls, platform: Platform) -> Tuple[bool, List[DependencyInfo]]:
         """Check if platform dependencies are satisfied"""
         deps = cls.PLATFORM_DEPS.get(platform, [])
-        all_satisfied = True
-        
-        for dep in deps:
-            if dep.check_command:
-                try:
-                    result = subprocess.run(
-                        dep.check_command.split(),
-                        capture_output=True,
-                        timeout=5
-                    )
-                    dep.installed = result.returncode == 0
-                except:
-                    dep.installed = False
-                
-                if dep.required and not dep.installed:
-                    all_satisfied = False
-        
+        probed = [dep for dep in deps if dep.check_command]
+
+        # The probes are independent subprocesses, so run them concurrently
+        # and let wall-time collapse to the slowest single check
+        if probed:
+            with ThreadPoolExecutor(max_workers=len(probed)) as executor:
+                futures = {
+                    executor.submit(cls._probe, platform, dep): dep
+                    for dep in probed
+                }
+                for future in as_completed(futures):
+                    futures[future].installed = future.result()
+
+        all_satisfied = all(dep.installed or not dep.required for dep in probed)
         return all_satisfied, deps
     
     @classmethod
@@ -504,7 +634,12 @@ class PlatformManager:
 
 class PlatformBuilder:
     """Base class for platform builders with enhanced capabilities"""
-    
+
+    # Extensions tracked for incremental build detection; subclasses narrow this
+    SOURCE_EXTENSIONS = {'.poh', '.json', '.xml', '.java', '.kt', '.swift', '.ts', '.js'}
+    # Output/dependency dirs that would dominate the walk with irrelevant entries
+    PRUNED_DIRS = {'build', 'node_modules', '.gradle', '.build_cache'}
+
     def __init__(self, build_cache: BuildCache):
         self.build_cache = build_cache
         self.build_history: List[BuildResult] = []
@@ -530,6 +665,7 @@ class PlatformBuilder:
             print(f"{'='*60}\n")
             
             # Check for incremental build
+            source_files = None
             if config.incremental and config.enable_cache:
                 source_files = self._get_source_files(config.project_dir)
                 changed_files = self.build_cache.get_changed_files(
@@ -549,9 +685,13 @@ class PlatformBuilder:
             
             # Update cache if successful
             if result.success and config.enable_cache:
-                source_files = self._get_source_files(config.project_dir)
-                for file in source_files:
-                    self.build_cache.update_cache(file, config.cache_key())
+                if source_files is None:
+                    source_files = self._get_source_files(config.project_dir)
+                self.build_cache.update_cache_batch(
+                    self.build_cache.hash_all(source_files),
+                    config.cache_key()
+                )
+                self.build_cache.flush()
             
         except Exception as e:
             result.errors.append(str(e))
@@ -566,11 +706,20 @@ class PlatformBuilder:
     
     def _get_source_files(self, project_dir: Path) -> List[Path]:
         """Get list of source files for incremental build detection"""
-        # Override in subclasses for platform-specific patterns
-        patterns = ['*.poh', '*.json', '*.xml', '*.java', '*.kt', '*.swift', '*.ts', '*.js']
+        # Override in subclasses for platform-specific extensions
+        return self._walk_source_files(project_dir, self.SOURCE_EXTENSIONS)
+
+    def _walk_source_files(self, root: Path, extensions: set) -> List[Path]:
+        """Collect files matching extensions in a single directory walk"""
         files = []
-        for pattern in patterns:
-            files.extend(project_dir.rglob(pattern))
+        pruned = self.PRUNED_DIRS
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in pruned]
+            base = Path(dirpath)
+            files.extend(
+                base / name for name in filenames
+                if os.path.splitext(name)[1] in extensions
+            )
         return files
     
     def _execute_build(self, config: BuildConfig, changed_files: List[Path]) -> BuildResult:
@@ -645,7 +794,9 @@ class PlatformBuilder:
 
 class AndroidBuilder(PlatformBuilder):
     """Android platform builder with optimizations"""
-    
+
+    SOURCE_EXTENSIONS = {'.java', '.kt', '.xml', '.gradle', '.kts', '.poh'}
+
     def _execute_build(self, config: BuildConfig, changed_files: List[Path]) -> BuildResult:
         """Execute Android build with Gradle"""
         result = BuildResult(success=False, duration=0)
@@ -719,11 +870,7 @@ class AndroidBuilder(PlatformBuilder):
     
     def _get_source_files(self, project_dir: Path) -> List[Path]:
         """Get Android source files"""
-        files = []
-        patterns = ['*.java', '*.kt', '*.xml', '*.gradle', '*.gradle.kts', '*.poh']
-        for pattern in patterns:
-            files.extend((project_dir / "app" / "src").rglob(pattern))
-        return files
+        return self._walk_source_files(project_dir / "app" / "src", self.SOURCE_EXTENSIONS)
     
     def run(self, project_dir: Path, device: Optional[str]) -> bool:
         """Run on Android device/emulator with better error handling"""
@@ -1090,7 +1237,9 @@ class WindowsBuilder(PlatformBuilder):
 
 class WebBuilder(PlatformBuilder):
     """Web platform builder with optimizations"""
-    
+
+    SOURCE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.css', '.scss', '.html', '.poh'}
+
     def _execute_build(self, config: BuildConfig, changed_files: List[Path]) -> BuildResult:
         """Execute web build with npm/webpack"""
         result = BuildResult(success=False, duration=0)
@@ -1180,13 +1329,7 @@ class WebBuilder(PlatformBuilder):
     
     def _get_source_files(self, project_dir: Path) -> List[Path]:
         """Get web source files"""
-        files = []
-        patterns = ['*.js', '*.ts', '*.jsx', '*.tsx', '*.css', '*.scss', '*.html', '*.poh']
-        src_dir = project_dir / "src"
-        if src_dir.exists():
-            for pattern in patterns:
-                files.extend(src_dir.rglob(pattern))
-        return files
+        return self._walk_source_files(project_dir / "src", self.SOURCE_EXTENSIONS)
     
     def run(self, project_dir: Path, device: Optional[str]) -> bool:
         """Run web dev server with better error handling"""